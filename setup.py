@@ -17,7 +17,16 @@ setup(
         "matplotlib>=3.3.2",
         "seaborn>=0.11.0",
         "scikit-learn>=0.24.1",
+        "scipy>=1.5.0",
         "statsmodels>=0.12.0",
+        "lightgbm>=3.0",
+        "pyarrow>=4.0.0",
+        "numba>=0.53.0",
+        "joblib>=1.3.0",
+        "orjson>=3.0.0",
+        "beautifulsoup4>=4.9.0",
+        "lxml>=4.6.0",
+        "requests>=2.25.0",
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
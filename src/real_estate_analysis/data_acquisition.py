@@ -1,17 +1,158 @@
 """
 
-Module for loading and previewing datasets.
+Module for loading and previewing various real estate datasets and performing data manipulation.
 
 Classes:
 - DatasetLoader: A class containing methods for loading and previewing datasets.
 
 """
+
+import os
+import tempfile
+
 import pandas as pd
 
+from real_estate_analysis.file_utils import load_table, read_csv
+
+ZILLOW_COLUMN_TYPES = {"RegionID": "int32", "SizeRank": "int32"}
+ZILLOW_CATEGORICAL_COLUMNS = ["RegionName", "RegionType", "StateName"]
+
 
 class DatasetLoader:
-    """Class to load dataset and preview it"""
+    """Class DatasetLoader to load the data with file_path and preview it"""
+
+    def __init__(self, base_path):
+        """
+        Constructor to initialize the DatasetLoader instance with a base path.
+
+        Parameters:
+        - base_path (str): The base path where the datasets are located.
+        """
+        self.base_path = base_path
+
+    @staticmethod
+    def _categorize(dataframe):
+        """
+        Convert the repeated region label columns to categorical dtype in place.
+
+        Grouping on categorical columns hashes their integer codes instead of
+        Python strings.
+
+        Parameters:
+        - dataframe (pd.DataFrame): The loaded Zillow dataset.
+
+        Returns:
+        pd.DataFrame: The same DataFrame with categorical region columns.
+        """
+        for column in ZILLOW_CATEGORICAL_COLUMNS:
+            if column in dataframe.columns:
+                dataframe[column] = dataframe[column].astype("category")
+        return dataframe
+
+    def _cached_read(self, csv_path, columns=None):
+        """
+        Read a CSV file through a Parquet cache stored next to it.
+
+        The CSV is parsed once, with ID columns as int32, values as float32 and
+        region labels as categoricals, and written to Parquet; later loads read the
+        Parquet file instead, as long as it is newer than the CSV. If the cache
+        cannot be written, the parsed CSV is returned all the same.
+
+        Parameters:
+        - csv_path (str): Path to the CSV file.
+        - columns (list, optional): Columns to read; all columns by default.
+
+        Returns:
+        pd.DataFrame: The loaded dataset.
+        """
+        parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+        if os.path.exists(parquet_path) and os.path.getmtime(
+            parquet_path
+        ) >= os.path.getmtime(csv_path):
+            return load_table(parquet_path, columns=columns)
+        dataframe = read_csv(
+            csv_path, column_types=ZILLOW_COLUMN_TYPES, downcast_floats=True
+        )
+        self._categorize(dataframe)
+        # Write to a temporary file and rename it, so an interrupted write never
+        # leaves a truncated cache that is newer than the CSV
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                suffix=".parquet", dir=os.path.dirname(parquet_path) or "."
+            )
+            os.close(fd)
+            try:
+                dataframe.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+                os.replace(tmp_path, parquet_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError:
+            # The cache is optional, e.g. in a read-only data directory
+            pass
+        return dataframe if columns is None else dataframe[columns]
+
+    def load_data_invt(self):
+        """Load the inventory dataset."""
+        file_path = f"{self.base_path}/Metro_invt_fs_uc_sfrcondo_sm_month (2).csv"
+        return self._cached_read(file_path)
+
+    def load_data_doz_pending(self):
+        """Load the dataset for Days on Zillow Pending."""
+        file_path = (
+            f"{self.base_path}/Metro_mean_doz_pending_uc_sfrcondo_sm_month (2).csv"
+        )
+        return self._cached_read(file_path)
+
+    def load_data_sales_count(self):
+        """Load the dataset for sales count."""
+        file_path = f"{self.base_path}/Metro_sales_count_now_uc_sfrcondo_month (2).csv"
+        return self._cached_read(file_path)
+
+    def load_data_home_value_growth(self):
+        """Load the dataset for home value growth."""
+        file_path = f"{self.base_path}/Metro_zhvf_growth_uc_sfrcondo_tier_0.33_0.67_sm_sa_month (1).csv"
+        return self._cached_read(file_path)
+
+    def load_data_home_value_index(self):
+        """Load the dataset for home value index."""
+        file_path = f"{self.base_path}/Metro_zhvi_uc_sfrcondo_tier_0.33_0.67_sm_sa_month (1).csv"
+        return self._cached_read(file_path)
+
+    def load_data_rental_index(self):
+        """Load the dataset for rental index."""
+        file_path = f"{self.base_path}/Metro_zori_uc_sfrcondomfr_sm_month (2).csv"
+        return self._cached_read(file_path)
+
+    def load_csv(self, file_path):
+        """Load a generic CSV file."""
+        return read_csv(file_path)
+
+    def filter_and_reshape_us_data(self, dataframe, drop_columns):
+        """
+        Filter and reshape data for the United States.
+
+        Parameters:
+        - dataframe (pd.DataFrame): The input DataFrame.
+        - drop_columns (list): Columns to drop from the input DataFrame.
+
+        Returns:
+        pd.DataFrame: Reshaped data for the United States.
+        """
+        us_row = (
+            dataframe[dataframe["RegionName"] == "United States"]
+            .drop(columns=drop_columns)
+            .iloc[0]
+        )
+        reshaped_data = pd.DataFrame(
+            {
+                "Date": pd.to_datetime(us_row.index, cache=True),
+                dataframe.name: us_row.to_numpy(),
+            }
+        )
+        return reshaped_data.sort_values(by="Date", kind="stable")
 
+    @staticmethod
     def load_dataset(filename):
         """
         Loads a dataset from the specified filename.
@@ -22,8 +163,9 @@ class DatasetLoader:
         Returns:
         DataFrame: The loaded dataset as a pandas DataFrame.
         """
-        return pd.read_csv(filename)
+        return read_csv(filename)
 
+    @staticmethod
     def preview_data(dataframe, num_rows=5):
         """
         Displays the first few rows of the dataset.
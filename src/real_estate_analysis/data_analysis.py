@@ -7,29 +7,130 @@ Module for analyzing and visualizing time-series data.
 
 """
 
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from numba import njit
+
+
+@lru_cache(maxsize=32)
+def _date_index(date_labels):
+    """
+    Parse a tuple of date column labels into a DatetimeIndex, cached by the labels.
+
+    All regions in a Zillow dataset share the same date columns, so the index only
+    needs to be parsed once per dataset.
+
+    Parameters:
+    - date_labels (tuple): The date column labels.
+
+    Returns:
+    pd.DatetimeIndex: The parsed dates.
+    """
+    return pd.to_datetime(list(date_labels), cache=True)
+
+
+@njit(cache=True)
+def _grouped_pct_change(codes, values, out):
+    """
+    Compute the percentage change between consecutive rows of the same group.
+
+    Parameters:
+    - codes (np.ndarray): Integer group codes, sorted so each group is contiguous.
+    - values (np.ndarray): Float values aligned with 'codes'.
+    - out (np.ndarray): Output array filled with the percentage changes.
+    """
+    for i in range(codes.size):
+        if i > 0 and codes[i] >= 0 and codes[i] == codes[i - 1]:
+            previous = values[i - 1]
+            change = values[i] - previous
+            if previous != 0.0:
+                out[i] = change / previous * 100.0
+            elif change > 0.0:
+                # Division by a zero previous value gives +/-inf or NaN, as in pandas
+                out[i] = np.inf
+            elif change < 0.0:
+                out[i] = -np.inf
+            else:
+                out[i] = np.nan
+        else:
+            out[i] = np.nan
+
+
+def _plain_keys(dataframe):
+    """
+    Converts categorical columns of an aggregation result back to their plain dtype.
+
+    The loaders store region labels as categoricals for fast grouping, but
+    observed=True only limits the groups: the result column still carries every
+    category, and so does anything filtered from it, which gives plots a legend
+    entry for each metro in the dataset.
+
+    Parameters:
+    - dataframe (pd.DataFrame): The aggregated DataFrame.
+
+    Returns:
+    pd.DataFrame: DataFrame with categorical columns converted back.
+    """
+    categorical = {
+        column: dtype.categories.dtype
+        for column, dtype in dataframe.dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype)
+    }
+    return dataframe.astype(categorical) if categorical else dataframe
 
 
 class DataAnalyzer:
     """Class DataAnalyzer to clean, identify missing_values, and preprocess and analyze the data"""
 
+    @staticmethod
+    def _year_values(dataframe, date_column):
+        """
+        Compute the year of each date in 'date_column' with a direct datetime64 cast.
+
+        Missing dates give NaN, as with .dt.year. The DataFrame is not modified.
+
+        Parameters:
+        - dataframe (pd.DataFrame): The input DataFrame.
+        - date_column (str): The name of the date column.
+
+        Returns:
+        np.ndarray: The year of each row.
+        """
+        dates = dataframe[date_column]
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            # .values holds UTC instants, so take the local year from pandas
+            return dates.dt.year.to_numpy()
+        dates = dates.to_numpy()
+        years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+        missing = np.isnat(dates)
+        if missing.any():
+            return np.where(missing, np.nan, years)
+        return years
+
+    @staticmethod
     def check_missing_values(dataframe):
         """Check and return the count of missing values in the DataFrame."""
         return dataframe.isnull().sum()
 
+    @staticmethod
     def get_statistical_summary(dataframe):
         """Return the statistical summary of the DataFrame."""
         return dataframe.describe()
 
+    @staticmethod
     def identify_missing_value_columns(dataframe):
         """Identify and return the columns with missing values."""
         return dataframe.columns[dataframe.isna().any()].tolist()
 
+    @staticmethod
     def display_initial_data(dataframe, num_rows=5):
         """Display the first few rows of the DataFrame."""
         return dataframe.head(num_rows)
 
+    @staticmethod
     def filter_data_for_plotting(
         dataframe, region_name, columns_to_drop, time_series_column="Inventory"
     ):
@@ -45,13 +146,17 @@ class DataAnalyzer:
         Returns:
         pd.DataFrame: Reshaped time-series data.
         """
-        filtered_data = dataframe[dataframe["RegionName"] == region_name]
-        time_series_data = filtered_data.drop(columns=columns_to_drop)
-        time_series_data = time_series_data.T
-        time_series_data.columns = [time_series_column]
-        time_series_data.index = pd.to_datetime(time_series_data.index)
-        return time_series_data
+        region_row = (
+            dataframe[dataframe["RegionName"] == region_name]
+            .drop(columns=columns_to_drop)
+            .iloc[0]
+        )
+        return pd.DataFrame(
+            {time_series_column: region_row.to_numpy()},
+            index=_date_index(tuple(region_row.index)),
+        )
 
+    @staticmethod
     def plot_time_series(
         data, title, x_label, y_label, figsize=(15, 6), marker="o", markersize=2
     ):
@@ -78,6 +183,7 @@ class DataAnalyzer:
         plt.grid(True)
         plt.show()
 
+    @staticmethod
     def add_year_column(dataframe, date_column):
         """
         Add a new column 'Year' based on the 'date_column'.
@@ -90,9 +196,10 @@ class DataAnalyzer:
         pd.DataFrame: DataFrame with an additional 'Year' column.
         """
         df_with_year = dataframe.copy()
-        df_with_year["Year"] = df_with_year[date_column].dt.year
+        df_with_year["Year"] = DataAnalyzer._year_values(df_with_year, date_column)
         return df_with_year
 
+    @staticmethod
     def calculate_annual_mean_inventory(dataframe, group_by_columns, value_column):
         """
         Calculate the annual mean of inventory based on specified grouping columns.
@@ -105,8 +212,13 @@ class DataAnalyzer:
         Returns:
         pd.DataFrame: DataFrame with annual mean inventory.
         """
-        return dataframe.groupby(group_by_columns)[value_column].mean().reset_index()
+        return _plain_keys(
+            dataframe.groupby(
+                group_by_columns, sort=False, observed=True, as_index=False
+            )[value_column].mean()
+        )
 
+    @staticmethod
     def calculate_yoy_change(dataframe, group_column, value_column):
         """
         Calculate year-over-year percentage change for the specified group and value columns.
@@ -120,11 +232,17 @@ class DataAnalyzer:
         pd.DataFrame: DataFrame with year-over-year percentage change.
         """
         df_with_yoy = dataframe.copy()
-        df_with_yoy["YoY_Change"] = (
-            df_with_yoy.groupby(group_column)[value_column].pct_change() * 100
-        )
+        codes, _ = pd.factorize(df_with_yoy[group_column])
+        order = np.argsort(codes, kind="stable")
+        values = df_with_yoy[value_column].to_numpy(dtype=np.float64)
+        sorted_changes = np.empty(codes.size)
+        _grouped_pct_change(codes[order], values[order], sorted_changes)
+        yoy_change = np.empty(codes.size)
+        yoy_change[order] = sorted_changes
+        df_with_yoy["YoY_Change"] = yoy_change
         return df_with_yoy
 
+    @staticmethod
     def calculate_annual_sum(dataframe, group_by_columns, value_column):
         """
         Calculate the annual sum of a specified value column based on grouping columns.
@@ -137,8 +255,13 @@ class DataAnalyzer:
         Returns:
         pd.DataFrame: DataFrame with annual sum values.
         """
-        return dataframe.groupby(group_by_columns)[value_column].sum().reset_index()
+        return _plain_keys(
+            dataframe.groupby(
+                group_by_columns, sort=False, observed=True, as_index=False
+            )[value_column].sum()
+        )
 
+    @staticmethod
     def calculate_correlation(dataframe, column1, column2):
         """
         Calculate the correlation between two columns in the DataFrame.
@@ -153,6 +276,7 @@ class DataAnalyzer:
         """
         return dataframe[[column1, column2]].corr().iloc[0, 1]
 
+    @staticmethod
     def calculate_yearly_change(dataframe, date_column, value_column):
         """
         Calculate the yearly percentage change for the specified date and value columns.
@@ -165,10 +289,11 @@ class DataAnalyzer:
         Returns:
         pd.Series: Series with yearly percentage changes.
         """
-        dataframe["Year"] = dataframe[date_column].dt.year
+        dataframe["Year"] = DataAnalyzer._year_values(dataframe, date_column)
         yearly_data = dataframe.groupby("Year")[value_column].mean()
         return yearly_data.pct_change() * 100
 
+    @staticmethod
     def analyze_seasonal_trends(dataframe, date_column, value_columns):
         """
         Analyze and return seasonal trends in the DataFrame based on specified date and value columns.
@@ -181,14 +306,16 @@ class DataAnalyzer:
         Returns:
         dict: Dictionary containing monthly trends for each specified value column.
         """
-        dataframe["Month-Year"] = dataframe[date_column].dt.to_period("M")
-        monthly_data = {}
-        for value_column in value_columns:
-            monthly_data[value_column] = dataframe.groupby("Month-Year")[
-                value_column
-            ].mean()
-        return monthly_data
+        monthly_data = (
+            dataframe.assign(**{"Month-Year": dataframe[date_column].dt.to_period("M")})
+            .groupby("Month-Year", observed=True)[value_columns]
+            .mean()
+        )
+        return {
+            value_column: monthly_data[value_column] for value_column in value_columns
+        }
 
+    @staticmethod
     def filter_data_for_period(dataframe, date_column, start_year, end_year):
         """
         Filter and return data for a specified period based on start and end years.
@@ -202,11 +329,10 @@ class DataAnalyzer:
         Returns:
         pd.DataFrame: DataFrame containing data for the specified period.
         """
-        return dataframe[
-            (dataframe[date_column].dt.year >= start_year)
-            & (dataframe[date_column].dt.year <= end_year)
-        ]
+        years = DataAnalyzer._year_values(dataframe, date_column)
+        return dataframe[(years >= start_year) & (years <= end_year)]
 
+    @staticmethod
     def calculates_yearly_changes(dataframe, date_column, value_columns):
         """
         Calculate yearly percentage changes for specified date and value columns.
@@ -219,12 +345,12 @@ class DataAnalyzer:
         Returns:
         dict: Dictionary containing yearly changes for each specified value column.
         """
-        dataframe["Year"] = dataframe[date_column].dt.year
-        yearly_changes = {}
-        for value_column in value_columns:
-            yearly_data = dataframe.groupby("Year")[value_column].mean()
-            yearly_changes[value_column] = yearly_data.pct_change() * 100
-        return yearly_changes
+        dataframe["Year"] = DataAnalyzer._year_values(dataframe, date_column)
+        yearly_data = dataframe.groupby("Year")[value_columns].mean()
+        yearly_changes = yearly_data.pct_change() * 100
+        return {
+            value_column: yearly_changes[value_column] for value_column in value_columns
+        }
 
     def filter_data_for_pandemic_analysis(
         self, dataframe, date_column, start_year, end_year
@@ -242,10 +368,8 @@ class DataAnalyzer:
         Returns:
         pd.DataFrame: DataFrame containing data for the specified pandemic period.
         """
-        filtered_data = dataframe[
-            (dataframe[date_column].dt.year >= start_year)
-            & (dataframe[date_column].dt.year <= end_year)
-        ]
+        years = DataAnalyzer._year_values(dataframe, date_column)
+        filtered_data = dataframe[(years >= start_year) & (years <= end_year)]
         return filtered_data
 
     def analyze_monthly_trends(self, dataframe, date_column, value_columns):
@@ -261,9 +385,11 @@ class DataAnalyzer:
         Returns:
         dict: Dictionary containing monthly trends for each specified value column.
         """
-        dataframe["Month-Year"] = dataframe[date_column].dt.to_period("M")
-        monthly_trends = {}
-        for value_column in value_columns:
-            monthly_data = dataframe.groupby("Month-Year")[value_column].mean()
-            monthly_trends[value_column] = monthly_data
-        return monthly_trends
+        monthly_trends = (
+            dataframe.assign(**{"Month-Year": dataframe[date_column].dt.to_period("M")})
+            .groupby("Month-Year", observed=True)[value_columns]
+            .mean()
+        )
+        return {
+            value_column: monthly_trends[value_column] for value_column in value_columns
+        }
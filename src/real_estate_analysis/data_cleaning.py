@@ -7,9 +7,35 @@ This module provides a set of functions for cleaning and manipulating pandas Dat
 import pandas as pd
 
 
+def to_arrow(dataframe, columns=None):
+    """
+    Cast object columns that hold strings to Arrow-backed string dtype.
+
+    Arrow stores the text in contiguous UTF-8 buffers, so string operations, groupby
+    and merges on these columns run in C instead of once per Python object. Callers
+    should keep the cast internal: downstream code selects text columns with
+    dtype == "object", which Arrow-backed columns no longer match.
+
+    Parameters:
+        dataframe (pd.DataFrame): The input DataFrame.
+        columns (list, optional): Columns to consider; all columns by default.
+
+    Returns:
+        pd.DataFrame: DataFrame with those string columns stored as "string[pyarrow]".
+    """
+    candidates = dataframe.columns if columns is None else pd.Index(columns)
+    string_columns = [
+        column
+        for column in candidates[dataframe.dtypes[candidates] == "object"]
+        if pd.api.types.infer_dtype(dataframe[column], skipna=True) == "string"
+    ]
+    return dataframe.astype(dict.fromkeys(string_columns, "string[pyarrow]"))
+
+
 class DataCleaner:
     """DataCleaner class with functions to clean and manipulate the DataFrame"""
 
+    @staticmethod
     def forward_fill(dataframe, columns):
         """
         Forward-fill missing values in specific columns of a DataFrame.
@@ -21,10 +47,11 @@ class DataCleaner:
         Returns:
             pd.DataFrame: DataFrame with missing values in specified columns forward-filled.
         """
-        df_cleaned = dataframe.copy()
-        df_cleaned[columns] = df_cleaned[columns].fillna(method="ffill")
-        return df_cleaned
+        if isinstance(columns, str):
+            columns = [columns]
+        return dataframe.assign(**{col: dataframe[col].ffill() for col in columns})
 
+    @staticmethod
     def drop_columns(dataframe, columns):
         """
         Drop specified columns from a DataFrame.
@@ -38,6 +65,7 @@ class DataCleaner:
         """
         return dataframe.drop(columns=columns)
 
+    @staticmethod
     def convert_to_datetime(dataframe, column_name, date_format="%Y-%m-%d"):
         """
         Convert a specific column to datetime format in a DataFrame.
@@ -50,12 +78,15 @@ class DataCleaner:
         Returns:
             pd.DataFrame: DataFrame with the specified column converted to datetime format.
         """
-        df_converted = dataframe.copy()
-        df_converted[column_name] = pd.to_datetime(
-            df_converted[column_name], format=date_format
+        return dataframe.assign(
+            **{
+                column_name: pd.to_datetime(
+                    dataframe[column_name], format=date_format, cache=True
+                )
+            }
         )
-        return df_converted
 
+    @staticmethod
     def forwards_fill(dataframe, axis=1):
         """
         Forward-fill missing values in a DataFrame along a specified axis.
@@ -67,8 +98,9 @@ class DataCleaner:
         Returns:
             pd.DataFrame: DataFrame with missing values forward-filled along the specified axis.
         """
-        return dataframe.fillna(method="ffill", axis=axis)
+        return dataframe.ffill(axis=axis)
 
+    @staticmethod
     def reshape_data_long(dataframe, id_vars, var_name, value_name):
         """
         Reshape a DataFrame to long format using pd.melt.
@@ -86,6 +118,7 @@ class DataCleaner:
             dataframe, id_vars=id_vars, var_name=var_name, value_name=value_name
         )
 
+    @staticmethod
     def convert_column_to_datetime(dataframe, column_name):
         """
         This function converts a specific column in a pandas DataFrame to datetime format.
@@ -97,10 +130,11 @@ class DataCleaner:
         Returns:
             A new pandas DataFrame with the specified column converted to datetime format.
         """
-        df_converted = dataframe.copy()
-        df_converted[column_name] = pd.to_datetime(df_converted[column_name])
-        return df_converted
+        return dataframe.assign(
+            **{column_name: pd.to_datetime(dataframe[column_name], cache=True)}
+        )
 
+    @staticmethod
     def get_data_types(dataframe):
         """
         This function returns the data types of all columns in a pandas DataFrame.
@@ -113,6 +147,7 @@ class DataCleaner:
         """
         return dataframe.dtypes
 
+    @staticmethod
     def identify_non_numeric_entries(dataframe, column_name):
         """
         This function identifies and returns rows in a pandas DataFrame where a specific column contains non-numeric entries.
@@ -124,8 +159,13 @@ class DataCleaner:
         Returns:
             A new pandas DataFrame containing only rows where the specified column contains non-numeric values.
         """
-        return dataframe[pd.to_numeric(dataframe[column_name], errors="coerce").isna()]
+        column = dataframe[column_name]
+        if pd.api.types.is_numeric_dtype(column):
+            # to_numeric would return the column unchanged, so only missing values count
+            return dataframe[column.isna()]
+        return dataframe[pd.to_numeric(column, errors="coerce").isna()]
 
+    @staticmethod
     def convert_column_to_numeric_and_fillna(dataframe, column_name, method="ffill"):
         """
         This function converts a specific column in a pandas DataFrame to numeric format and fills in missing values using the specified method.
@@ -138,9 +178,11 @@ class DataCleaner:
         Returns:
             A new pandas DataFrame with the specified column converted to numeric format and missing values filled.
         """
-        df_converted = dataframe.copy()
-        df_converted[column_name] = pd.to_numeric(
-            df_converted[column_name], errors="coerce"
-        )
-        df_converted[column_name] = df_converted[column_name].fillna(method=method)
-        return df_converted
+        numeric_column = pd.to_numeric(dataframe[column_name], errors="coerce")
+        if method == "ffill":
+            numeric_column = numeric_column.ffill()
+        elif method == "bfill":
+            numeric_column = numeric_column.bfill()
+        else:
+            numeric_column = numeric_column.fillna(method=method)
+        return dataframe.assign(**{column_name: numeric_column})
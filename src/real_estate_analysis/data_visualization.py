@@ -5,25 +5,155 @@ This module provides a class, DataVisualizer, for visualizing data using Seaborn
 It includes methods for plotting line graphs and time series data.
 
 """
-import seaborn as sns
+import functools
+
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+# Simplify and chunk long paths so Agg renders long time series faster. Applied
+# only while a plot method runs, so other figures keep the user's settings.
+_FAST_PATH_RC = {"path.simplify_threshold": 1.0, "agg.path.chunksize": 10000}
+
+# Figures reused across plot calls, keyed by figure size.
+_FIG_CACHE = {}
+
+
+def _fast_paths(plot_method):
+    """
+    Runs a plot method, including its plt.show(), under _FAST_PATH_RC.
+
+    Parameters
+    ----------
+    plot_method : callable
+        The plot method to wrap.
+
+    Returns
+    -------
+    callable
+        The wrapped method.
+    """
+
+    @functools.wraps(plot_method)
+    def wrapper(*args, **kwargs):
+        with plt.rc_context(_FAST_PATH_RC):
+            return plot_method(*args, **kwargs)
+
+    return wrapper
+
+
+def _get_or_create(figsize, ax=None, show=True):
+    """
+    Returns a cleared Figure and Axes for the given size.
+
+    A cached Figure is only reused when the plot is shown right away. With
+    show=False the caller keeps the result, so each call gets a new Figure that a
+    later plot cannot clear.
+
+    Parameters
+    ----------
+    figsize : tuple
+        The size of the figure (width, height).
+    ax : Axes, optional
+        Axes supplied by the caller; used as-is when given.
+    show : bool, optional
+        Whether the plot is shown right away, by default True.
+
+    Returns
+    -------
+    tuple
+        The Figure and Axes to draw on.
+    """
+    if ax is not None:
+        return ax.figure, ax
+    if not show:
+        fig = plt.figure(figsize=figsize)
+        return fig, fig.add_subplot()
+    fig = _FIG_CACHE.get(figsize)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = plt.figure(figsize=figsize)
+        _FIG_CACHE[figsize] = fig
+    else:
+        plt.figure(fig.number)
+        fig.clf()
+    return fig, fig.add_subplot()
+
+
+def _plot_columns_as_collection(ax, x, data, columns):
+    """
+    Draws several columns against a shared date axis as a single LineCollection.
+
+    Parameters
+    ----------
+    ax : Axes
+        The axes to draw on.
+    x : Series
+        Dates, periods, or date strings shared by all lines.
+    data : DataFrame
+        The data containing the columns to plot.
+    columns : list
+        The columns to draw, one line each.
+
+    Returns
+    -------
+    None
+    """
+    if isinstance(x.dtype, pd.PeriodDtype):
+        x = x.dt.to_timestamp()
+    x_values = mdates.date2num(pd.to_datetime(x))
+    # One 2-D extraction instead of a __getitem__ per column; the (K, n, 2)
+    # vertex array is handed to LineCollection as-is.
+    y_values = data[list(columns)].to_numpy(dtype=float).T
+    segments = np.empty(y_values.shape + (2,))
+    segments[..., 0] = x_values
+    segments[..., 1] = y_values
+    colors = plt.cm.tab10(np.arange(len(columns)) % 10)
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=1.5))
+    ax.autoscale()
+    ax.xaxis_date()
+    ax.legend(
+        handles=[
+            Line2D([], [], color=color, label=column)
+            for color, column in zip(colors, columns)
+        ]
+    )
 
 
 class DataVisualizer:
     """
     A class for visualizing data using Seaborn and Matplotlib.
 
+    Every plot method draws on the supplied ``ax`` or on a Figure of the requested
+    size, and only calls ``plt.show()`` when ``show`` is True. Shown plots reuse a
+    cached Figure per size.
+
     Methods
     -------
-    plot_line(data, x, y, hue, title, x_label, y_label, figsize=(15, 8), marker="o")
+    plot_line(data, x, y, hue, title, x_label, y_label, figsize=(15, 8), marker="o", ax=None, show=True)
         Plots a line graph using Seaborn.
 
-    plot_time_series(data, title, x_label, y_label, figsize=(15, 6))
+    plot_time_series(data, title, x_label, y_label, figsize=(15, 6), ax=None, show=True)
         Plots time series data using Seaborn.
     """
 
+    @staticmethod
+    @_fast_paths
     def plot_line(
-        data, x, y, hue, title, x_label, y_label, figsize=(15, 8), marker="o"
+        data,
+        x,
+        y,
+        hue,
+        title,
+        x_label,
+        y_label,
+        figsize=(15, 8),
+        marker="o",
+        ax=None,
+        show=True,
     ):
         """
         Plots a line graph using Seaborn.
@@ -48,20 +178,31 @@ class DataVisualizer:
             The size of the figure (width, height), by default (15, 8).
         marker : str, optional
             The marker style for data points on the line, by default "o".
+        ax : Axes, optional
+            Axes to draw on, by default a Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
 
         Returns
         -------
         None
         """
-        plt.figure(figsize=figsize)
-        sns.lineplot(data=data, x=x, y=y, hue=hue, marker=marker)
-        plt.title(title)
-        plt.xlabel(x_label)
-        plt.ylabel(y_label)
-        plt.grid(True)
-        plt.show()
-
-    def plot_time_series(self, data, title, x_label, y_label, figsize=(15, 6)):
+        if hue is not None and isinstance(data[hue].dtype, pd.CategoricalDtype):
+            # Seaborn takes the hue order from the categories, used or not
+            data = data.assign(**{hue: data[hue].cat.remove_unused_categories()})
+        fig, ax = _get_or_create(figsize, ax, show)
+        sns.lineplot(data=data, x=x, y=y, hue=hue, marker=marker, ax=ax)
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+        ax.grid(True)
+        if show:
+            plt.show()
+
+    @_fast_paths
+    def plot_time_series(
+        self, data, title, x_label, y_label, figsize=(15, 6), ax=None, show=True
+    ):
         """
         Plots time series data using Seaborn.
 
@@ -77,24 +218,39 @@ class DataVisualizer:
             The label for the y-axis.
         figsize : tuple, optional
             The size of the figure (width, height), by default (15, 6).
+        ax : Axes, optional
+            Axes to draw on, by default a Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
 
         Returns
         -------
         None
         """
-        plt.figure(figsize=figsize)
-        for column in data.columns[1:]:
-            sns.lineplot(x=data["Date"], y=data[column], label=column)
-        plt.title(title)
-        plt.xlabel(x_label)
-        plt.ylabel(y_label)
-        plt.legend()
-        plt.show()
-
-    def plot_heatmap(self, data, title, figsize=(6, 4)):
+        fig, ax = _get_or_create(figsize, ax, show)
+        _plot_columns_as_collection(ax, data["Date"], data, data.columns[1:])
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+        if show:
+            plt.show()
+
+    @_fast_paths
+    def plot_heatmap(
+        self,
+        data,
+        title,
+        figsize=(6, 4),
+        annotate_threshold=0.0,
+        ax=None,
+        show=True,
+    ):
         """
         Plots a heatmap to visualize the correlation matrix of the input data.
 
+        The matrix is drawn as a single rasterized image, and only cells whose
+        absolute correlation reaches annotate_threshold get a text label.
+
         Parameters
         ----------
         data : DataFrame
@@ -103,17 +259,46 @@ class DataVisualizer:
             The title of the heatmap.
         figsize : tuple, optional
             The size of the figure (width, height), by default (6, 4).
+        annotate_threshold : float, optional
+            Minimum absolute correlation for a cell to be annotated, by default 0.0
+            (annotate every cell). Raise it for wide frames to skip most labels.
+        ax : Axes, optional
+            Axes to draw on, by default a Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
 
         Returns
         -------
         None
         """
-        plt.figure(figsize=figsize)
-        sns.heatmap(data.corr(), annot=True, cmap="coolwarm")
-        plt.title(title)
-        plt.show()
+        correlation = data.corr(method="pearson", numeric_only=True)
+        values = correlation.to_numpy()
+        fig, ax = _get_or_create(figsize, ax, show)
+        image = ax.imshow(values, cmap="coolwarm", vmin=-1, vmax=1, rasterized=True)
+        fig.colorbar(image, ax=ax)
+        ax.set_xticks(range(len(correlation.columns)))
+        ax.set_xticklabels(correlation.columns, rotation=90)
+        ax.set_yticks(range(len(correlation.index)))
+        ax.set_yticklabels(correlation.index)
+        for row, col in zip(*np.nonzero(np.abs(values) >= annotate_threshold)):
+            ax.text(col, row, f"{values[row, col]:.2g}", ha="center", va="center")
+        ax.set_title(title)
+        if show:
+            plt.show()
 
-    def plot_bar(self, data, title, x_label, y_label, color, alpha=0.6):
+    @_fast_paths
+    def plot_bar(
+        self,
+        data,
+        title,
+        x_label,
+        y_label,
+        color,
+        alpha=0.6,
+        figsize=(15, 6),
+        ax=None,
+        show=True,
+    ):
         """
         Plots a bar chart for the input data.
 
@@ -131,20 +316,30 @@ class DataVisualizer:
             The color of the bars.
         alpha : float, optional
             The transparency of the bars, by default 0.6.
+        figsize : tuple, optional
+            The size of the figure (width, height), by default (15, 6).
+        ax : Axes, optional
+            Axes to draw on, by default a Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
 
         Returns
         -------
         None
         """
-        plt.figure(figsize=(15, 6))
-        data.plot(kind="bar", color=color, alpha=alpha)
-        plt.title(title)
-        plt.xlabel(x_label)
-        plt.ylabel(y_label)
-        plt.grid(True)
-        plt.show()
-
-    def plot_line_seasonal(self, data, title, x_label, y_label):
+        fig, ax = _get_or_create(figsize, ax, show)
+        data.plot(kind="bar", color=color, alpha=alpha, ax=ax)
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+        ax.grid(True)
+        if show:
+            plt.show()
+
+    @_fast_paths
+    def plot_line_seasonal(
+        self, data, title, x_label, y_label, figsize=(15, 8), ax=None, show=True
+    ):
         """
         Plots a seasonal line plot for the input data.
 
@@ -158,19 +353,26 @@ class DataVisualizer:
             The label for the x-axis.
         y_label : str
             The label for the y-axis.
+        figsize : tuple, optional
+            The size of the figure (width, height), by default (15, 8).
+        ax : Axes, optional
+            Axes to draw on, by default a Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
 
         Returns
         -------
         None
         """
-        plt.figure(figsize=(15, 8))
-        for column in data.columns[1:]:  # Assuming the first column is 'Month-Year'
-            sns.lineplot(x=data["Month-Year"], y=data[column], label=column)
-        plt.title(title)
-        plt.xlabel(x_label)
-        plt.ylabel(y_label)
-        plt.xticks(rotation=45)  # Rotating x-axis labels for better readability
-        plt.legend()
-        plt.grid(True)
-        plt.tight_layout()  # Adjusting layout
-        plt.show()
+        fig, ax = _get_or_create(figsize, ax, show)
+        # Assuming the first column is 'Month-Year'
+        _plot_columns_as_collection(ax, data["Month-Year"], data, data.columns[1:])
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+        # Rotating x-axis labels for better readability
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.grid(True)
+        fig.tight_layout()  # Adjusting layout
+        if show:
+            plt.show()
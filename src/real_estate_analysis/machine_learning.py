@@ -7,12 +7,112 @@ This module defines classes for building machine learning models and evaluating
 
 """
 
+import weakref
+
+import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from joblib import Parallel, delayed
+from lightgbm import LGBMRegressor
+from numba import njit, prange
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
 from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from sklearn.model_selection import train_test_split
 
+# Sorted feature-importance DataFrames keyed by fitted model, stored with the
+# model's attributes at the time so that a refit invalidates the entry.
+_FEATURE_IMPORTANCE_CACHE = weakref.WeakKeyDictionary()
+
+
+def _same_state(state, model):
+    """
+    Checks whether a model still holds the attribute objects captured in state.
+
+    Fitting assigns new objects to a model's fitted attributes (estimators_,
+    booster_, ...), so identity comparison detects a refit without hashing
+    any data.
+
+    Parameters
+    ----------
+    state : dict
+        A copy of the model's attribute dictionary.
+    model : object
+        The model to compare against.
+
+    Returns
+    -------
+    bool
+        True if every attribute is the same object as in state.
+    """
+    current = vars(model)
+    return current.keys() == state.keys() and all(
+        current[name] is value for name, value in state.items()
+    )
+
+
+def _to_c_float32(X):
+    """
+    Converts features to a C-contiguous float32 array.
+
+    Tree models read whole rows at a time, so row-major float32 data keeps
+    fitting and prediction cache-friendly and halves memory bandwidth.
+
+    Parameters
+    ----------
+    X : DataFrame or array-like
+        Feature data.
+
+    Returns
+    -------
+    ndarray
+        C-contiguous float32 array.
+    """
+    return np.ascontiguousarray(
+        X.values if hasattr(X, "values") else X, dtype=np.float32
+    )
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _regression_metrics(y_true, y_pred):
+    """
+    Computes MAE, MSE and R-squared in two passes over the data.
+
+    The total variance is summed around the mean rather than derived from the
+    raw sums of squares, which cancel catastrophically for large targets such
+    as home values. As in sklearn's r2_score, a constant target scores 1.0 for
+    a perfect prediction and 0.0 otherwise.
+
+    Parameters
+    ----------
+    y_true : ndarray
+        True labels.
+    y_pred : ndarray
+        Predicted labels.
+
+    Returns
+    -------
+    tuple
+        Mean Absolute Error, Mean Squared Error, R-squared.
+    """
+    n = y_true.size
+    sum_y = 0.0
+    for i in prange(n):
+        sum_y += y_true[i]
+    mean = sum_y / n
+    sum_abs = 0.0
+    sum_sq = 0.0
+    total_variance = 0.0
+    for i in prange(n):
+        error = y_true[i] - y_pred[i]
+        deviation = y_true[i] - mean
+        sum_abs += abs(error)
+        sum_sq += error * error
+        total_variance += deviation * deviation
+    if total_variance == 0.0:
+        r2 = 1.0 if sum_sq == 0.0 else 0.0
+    else:
+        r2 = 1.0 - sum_sq / total_variance
+    return sum_abs / n, sum_sq / n, r2
+
 
 class ModelBuilder:
     """
@@ -20,23 +120,32 @@ class ModelBuilder:
 
     Methods
     -------
-    build_random_forest(X_train, y_train, n_estimators=100, random_state=0)
+    build_random_forest(X_train, y_train, n_estimators=100, random_state=0, n_jobs=-1, model=None)
         Builds a Random Forest regression model.
 
+    build_hist_gbrt(X_train, y_train, max_iter=100, max_bins=255, random_state=0)
+        Builds a histogram-based Gradient Boosting regression model.
+
     make_predictions(model, X_test)
         Makes predictions using the given model.
 
     extract_feature_importances(model, feature_names)
         Extracts feature importances from the given model.
 
-    build_gradient_boosting(X_train, y_train, n_estimators=100, random_state=42)
-        Builds a Gradient Boosting regression model.
+    build_gradient_boosting(X_train, y_train, n_estimators=100, random_state=42, device="cpu")
+        Builds a LightGBM Gradient Boosting regression model.
 
     build_linear_regression(X_train, y_train)
         Builds a Linear Regression model.
+
+    build_all(X_train, y_train, n_estimators=100, random_state=0)
+        Builds the Random Forest, Gradient Boosting and Linear Regression models in parallel.
     """
 
-    def build_random_forest(X_train, y_train, n_estimators=100, random_state=0):
+    @staticmethod
+    def build_random_forest(
+        X_train, y_train, n_estimators=100, random_state=0, n_jobs=-1, model=None
+    ):
         """
         Builds a Random Forest regression model.
 
@@ -50,18 +159,66 @@ class ModelBuilder:
             Number of trees in the forest, by default 100.
         random_state : int, optional
             Seed for random state, by default 0.
+        n_jobs : int, optional
+            Number of jobs used to fit and predict in parallel, by default -1 (all cores).
+        model : RandomForestRegressor, optional
+            Previously trained forest to grow to n_estimators trees with warm_start
+            instead of retraining from scratch, by default None.
 
         Returns
         -------
         RandomForestRegressor
             Trained Random Forest model.
         """
-        model = RandomForestRegressor(
-            n_estimators=n_estimators, random_state=random_state
+        X_train = _to_c_float32(X_train)
+        if model is None:
+            model = RandomForestRegressor(
+                n_estimators=n_estimators, random_state=random_state, n_jobs=n_jobs
+            )
+        else:
+            model.set_params(n_estimators=n_estimators, n_jobs=n_jobs, warm_start=True)
+        model.fit(X_train, y_train)
+        return model
+
+    @staticmethod
+    def build_hist_gbrt(X_train, y_train, max_iter=100, max_bins=255, random_state=0):
+        """
+        Builds a histogram-based Gradient Boosting regression model.
+
+        Features are binned into at most 255 integer bins once up front, so split
+        finding accumulates histograms instead of sorting at every node. This is
+        the recommended alternative to build_random_forest for the dense numeric
+        data used in this project.
+
+        Parameters
+        ----------
+        X_train : DataFrame
+            Training data features.
+        y_train : Series
+            Training data labels.
+        max_iter : int, optional
+            Number of boosting iterations, by default 100.
+        max_bins : int, optional
+            Maximum number of bins per feature, by default 255.
+        random_state : int, optional
+            Seed for random state, by default 0.
+
+        Returns
+        -------
+        HistGradientBoostingRegressor
+            Trained histogram-based Gradient Boosting model.
+        """
+        X_train = _to_c_float32(X_train)
+        model = HistGradientBoostingRegressor(
+            max_iter=max_iter,
+            max_bins=max_bins,
+            early_stopping=False,
+            random_state=random_state,
         )
         model.fit(X_train, y_train)
         return model
 
+    @staticmethod
     def make_predictions(model, X_test):
         """
         Makes predictions using the given model.
@@ -75,11 +232,13 @@ class ModelBuilder:
 
         Returns
         -------
-        array
-            Model predictions.
+        ndarray
+            Model predictions as a float32 array.
         """
-        return model.predict(X_test)
+        X_test = _to_c_float32(X_test)
+        return np.asarray(model.predict(X_test), dtype=np.float32)
 
+    @staticmethod
     def extract_feature_importances(model, feature_names):
         """
         Extracts feature importances from the given model.
@@ -96,15 +255,33 @@ class ModelBuilder:
         DataFrame
             DataFrame with feature names and their importances.
         """
-        feature_importances = model.feature_importances_
+        feature_names = tuple(feature_names)
+        cached = _FEATURE_IMPORTANCE_CACHE.get(model)
+        if (
+            cached is not None
+            and cached[0] == feature_names
+            and _same_state(cached[1], model)
+        ):
+            return cached[2].copy()
         importance_df = pd.DataFrame(
-            {"Feature": feature_names, "Importance": feature_importances}
+            {"Feature": feature_names, "Importance": model.feature_importances_}
+        ).sort_values(by="Importance", ascending=False, kind="stable")
+        _FEATURE_IMPORTANCE_CACHE[model] = (
+            feature_names,
+            dict(vars(model)),
+            importance_df,
         )
-        return importance_df.sort_values(by="Importance", ascending=False)
+        return importance_df.copy()
 
-    def build_gradient_boosting(X_train, y_train, n_estimators=100, random_state=42):
+    @staticmethod
+    def build_gradient_boosting(
+        X_train, y_train, n_estimators=100, random_state=42, device="cpu"
+    ):
         """
-        Builds a Gradient Boosting regression model.
+        Builds a Gradient Boosting regression model using LightGBM.
+
+        LightGBM bins features into histograms and searches splits in parallel,
+        which trains considerably faster than sklearn's GradientBoostingRegressor.
 
         Parameters
         ----------
@@ -116,18 +293,28 @@ class ModelBuilder:
             Number of boosting stages to be run, by default 100.
         random_state : int, optional
             Seed for random state, by default 42.
+        device : str, optional
+            Device used for training ("cpu" or "gpu"), by default "cpu".
 
         Returns
         -------
-        GradientBoostingRegressor
+        LGBMRegressor
             Trained Gradient Boosting model.
         """
-        model = GradientBoostingRegressor(
-            n_estimators=n_estimators, random_state=random_state
+        X_train = _to_c_float32(X_train)
+        model = LGBMRegressor(
+            n_estimators=n_estimators,
+            random_state=random_state,
+            num_leaves=31,
+            max_bin=255,
+            n_jobs=-1,
+            objective="regression",
+            device=device,
         )
         model.fit(X_train, y_train)
         return model
 
+    @staticmethod
     def build_linear_regression(X_train, y_train):
         """
         Builds a Linear Regression model.
@@ -144,10 +331,52 @@ class ModelBuilder:
         LinearRegression
             Trained Linear Regression model.
         """
+        X_train = _to_c_float32(X_train)
         model = LinearRegression()
         model.fit(X_train, y_train)
         return model
 
+    @staticmethod
+    def build_all(X_train, y_train, n_estimators=100, random_state=0):
+        """
+        Builds the Random Forest, Gradient Boosting and Linear Regression models in parallel.
+
+        Each model is trained in its own worker process, so the wall time is that of
+        the slowest model rather than the sum of all three.
+
+        Parameters
+        ----------
+        X_train : DataFrame
+            Training data features.
+        y_train : Series
+            Training data labels.
+        n_estimators : int, optional
+            Number of trees or boosting stages for the ensemble models, by default 100.
+        random_state : int, optional
+            Seed for random state, by default 0.
+
+        Returns
+        -------
+        dict
+            Trained models keyed by "rf", "gb" and "lr".
+        """
+        builders = [
+            (
+                ModelBuilder.build_random_forest,
+                # One thread per forest avoids oversubscribing the worker processes.
+                {"n_estimators": n_estimators, "random_state": random_state, "n_jobs": 1},
+            ),
+            (
+                ModelBuilder.build_gradient_boosting,
+                {"n_estimators": n_estimators, "random_state": random_state},
+            ),
+            (ModelBuilder.build_linear_regression, {}),
+        ]
+        models = Parallel(n_jobs=len(builders), backend="loky")(
+            delayed(builder)(X_train, y_train, **kwargs) for builder, kwargs in builders
+        )
+        return dict(zip(["rf", "gb", "lr"], models))
+
 
 class ModelEvaluator:
     """
@@ -165,6 +394,7 @@ class ModelEvaluator:
         Extracts coefficients from the given linear regression model.
     """
 
+    @staticmethod
     def evaluate_model(y_true, y_pred):
         """
         Evaluates the performance of a model using Mean Absolute Error, Root Mean Squared Error, and R-squared.
@@ -181,11 +411,12 @@ class ModelEvaluator:
         tuple
             Mean Absolute Error, Root Mean Squared Error, R-squared.
         """
-        mae = mean_absolute_error(y_true, y_pred)
-        rmse = mean_squared_error(y_true, y_pred, squared=False)
-        r2 = r2_score(y_true, y_pred)
-        return mae, rmse, r2
+        y_true = np.ascontiguousarray(y_true, dtype=np.float64)
+        y_pred = np.ascontiguousarray(y_pred, dtype=np.float64)
+        mae, mse, r2 = _regression_metrics(y_true, y_pred)
+        return mae, np.sqrt(mse), r2
 
+    @staticmethod
     def get_feature_importances(model, feature_names):
         """
         Gets feature importances from the given model.
@@ -202,12 +433,9 @@ class ModelEvaluator:
         DataFrame
             DataFrame with feature names and their importances.
         """
-        feature_importances = model.feature_importances_
-        importance_df = pd.DataFrame(
-            {"Feature": feature_names, "Importance": feature_importances}
-        )
-        return importance_df.sort_values(by="Importance", ascending=False)
+        return ModelBuilder.extract_feature_importances(model, feature_names)
 
+    @staticmethod
     def extract_coefficients(model, feature_names):
         """
         Extracts coefficients from the given linear regression model.
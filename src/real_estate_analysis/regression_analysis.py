@@ -4,14 +4,141 @@
 This module defines a class, RegressionModeler, for preparing data, training regression models,
 evaluating their performance, creating lag features, dropping missing values, and performing feature selection.
 
+
+Set REAL_ESTATE_ANALYSIS_SKLEARNEX=1 to patch scikit-learn with the Intel Extension
+(scikit-learn-intelex) so the Random Forest is trained with oneDAL.
+
+Set REAL_ESTATE_ANALYSIS_POLARS=1 to run the merge, column selection and dropna in
+prepare_data as a single lazy Polars query.
+
+Otherwise prepare_data caches its merges on disk, in REAL_ESTATE_ANALYSIS_CACHE_DIR
+or by default in real_estate_analysis under the user's cache directory
+($XDG_CACHE_HOME or ~/.cache). The cache is trimmed to its most recently used
+1 GB after each merge.
+
+When cuML and CuPy are installed and a CUDA device is visible, the Random Forest
+is trained on the GPU with cuml.ensemble.RandomForestRegressor instead.
+
 """
 
+import hashlib
+import os
+
+if os.environ.get("REAL_ESTATE_ANALYSIS_SKLEARNEX") == "1":
+    from sklearnex import patch_sklearn
+
+    patch_sklearn()
+
+if os.environ.get("REAL_ESTATE_ANALYSIS_POLARS") == "1":
+    import polars as pl
+else:
+    pl = None
+
+import numpy as np
 import pandas as pd
+from joblib import Memory
+from numba import njit, prange
+from pandas.api.types import union_categoricals
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_squared_error, r2_score
-from sklearn.feature_selection import RFE
-from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import LassoCV, lasso_path
+from sklearn.preprocessing import StandardScaler
+
+from real_estate_analysis.data_cleaning import to_arrow
+from real_estate_analysis.machine_learning import _regression_metrics
+
+try:
+    import cupy as cp
+    from cuml.ensemble import RandomForestRegressor as GPURandomForestRegressor
+
+    _CUDA_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except (ImportError, RuntimeError):
+    _CUDA_AVAILABLE = False
+
+_CACHE_DIR = os.environ.get("REAL_ESTATE_ANALYSIS_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "real_estate_analysis",
+)
+_CACHE_BYTES_LIMIT = "1G"
+_MEMORY = Memory(_CACHE_DIR, mmap_mode="r", verbose=0)
+
+
+def _frame_fingerprint(dataframe):
+    """
+    Computes a cheap fingerprint of a DataFrame's columns, index, and values.
+
+    Parameters
+    ----------
+    dataframe : DataFrame
+        DataFrame to fingerprint.
+
+    Returns
+    -------
+    tuple
+        Column names and a digest of the row hashes.
+    """
+    row_hashes = pd.util.hash_pandas_object(dataframe, index=True).to_numpy()
+    return tuple(map(str, dataframe.columns)), hashlib.sha1(row_hashes).hexdigest()
+
+
+@_MEMORY.cache(ignore=["df1", "df2"])
+def _merge_and_select(
+    df1_fingerprint,
+    df2_fingerprint,
+    on_columns,
+    feature_columns,
+    target_column,
+    df1,
+    df2,
+):
+    """
+    Merges two DataFrames and keeps the complete rows of the regression columns.
+
+    Non-numeric merge keys are converted to categoricals with aligned categories first.
+
+    Results are cached on disk by the DataFrame fingerprints and column lists, so the
+    frames themselves are excluded from the cache key.
+
+    Returns
+    -------
+    DataFrame
+        Feature and target columns with missing values dropped.
+    """
+    key_dtypes = {}
+    for column in on_columns:
+        if not pd.api.types.is_numeric_dtype(df1[column]):
+            # Shared categories let the merge hash integer codes instead of strings
+            categories = union_categoricals(
+                [df1[column].astype("category"), df2[column].astype("category")]
+            ).categories
+            key_dtypes[column] = pd.CategoricalDtype(categories)
+    df1 = df1.astype(key_dtypes)
+    df2 = df2.astype(key_dtypes)
+    merged_data = pd.merge(df1, df2, on=list(on_columns), how="inner", sort=False)
+    return merged_data[list(feature_columns) + [target_column]].dropna()
+
+
+@njit(parallel=True, cache=True)
+def _lag_kernel(values, lags, out):
+    """
+    Writes each lagged copy of 'values' into a column of the NaN-filled 'out' buffer.
+
+    Parameters
+    ----------
+    values : ndarray
+        Values of the column to lag.
+    lags : ndarray
+        Lags to apply, one per output column.
+    out : ndarray
+        Output buffer of shape (len(values), len(lags)).
+    """
+    n = values.size
+    for j in prange(lags.size):
+        lag = lags[j]
+        for i in range(n):
+            source = i - lag
+            if 0 <= source < n:
+                out[i, j] = values[source]
 
 
 class RegressionModeler:
@@ -41,12 +168,77 @@ class RegressionModeler:
         tuple
             Features (X) and target variable (y).
         """
-        merged_data = pd.merge(df1, df2, on=on_columns, how="inner")
-        regression_data = merged_data[feature_columns + [target_column]].dropna()
+        # Only the merge keys are cast to Arrow, where they speed up the join
+        df1 = to_arrow(df1, on_columns)
+        df2 = to_arrow(df2, on_columns)
+        if pl is not None:
+            regression_data = self.prepare_data_polars(
+                df1, df2, on_columns, feature_columns, target_column
+            )
+        else:
+            # Only the merge keys and regression columns are hashed and merged
+            used = set(on_columns).union(feature_columns, [target_column])
+            df1 = df1[[column for column in df1.columns if column in used]]
+            df2 = df2[[column for column in df2.columns if column in used]]
+            regression_data = _merge_and_select(
+                _frame_fingerprint(df1),
+                _frame_fingerprint(df2),
+                tuple(on_columns),
+                tuple(feature_columns),
+                target_column,
+                df1,
+                df2,
+            )
+            _MEMORY.reduce_size(bytes_limit=_CACHE_BYTES_LIMIT)
         X = regression_data[feature_columns]
         y = regression_data[target_column]
+        # float32 halves the bytes scikit-learn streams through during fitting
+        float_columns = [
+            column
+            for column in feature_columns
+            if pd.api.types.is_float_dtype(X[column])
+        ]
+        X = X.astype(dict.fromkeys(float_columns, np.float32))
+        if pd.api.types.is_float_dtype(y):
+            y = y.astype(np.float32)
         return X, y
 
+    def prepare_data_polars(self, df1, df2, on_columns, feature_columns, target_column):
+        """
+        Merges two DataFrames and keeps the complete rows of the regression columns,
+        using a lazy Polars query.
+
+        Polars pushes the column selection below the join, so columns that are not
+        needed for the regression are never materialized in the merged result.
+
+        Parameters
+        ----------
+        df1 : DataFrame
+            The first DataFrame to be merged.
+        df2 : DataFrame
+            The second DataFrame to be merged.
+        on_columns : list
+            Columns used for merging the DataFrames.
+        feature_columns : list
+            Columns used as features in the regression model.
+        target_column : str
+            The target variable column.
+
+        Returns
+        -------
+        DataFrame
+            Feature and target columns with missing values dropped.
+        """
+        return (
+            pl.from_pandas(df1)
+            .lazy()
+            .join(pl.from_pandas(df2).lazy(), on=list(on_columns), how="inner")
+            .select(list(feature_columns) + [target_column])
+            .drop_nulls()
+            .collect()
+            .to_pandas()
+        )
+
     def split_data(self, X, y, test_size, random_state):
         """
         Splits data into training and testing sets.
@@ -87,10 +279,22 @@ class RegressionModeler:
         Returns
         -------
         RandomForestRegressor
-            Trained Random Forest model.
+            Trained Random Forest model; a cuML model when a CUDA device is available.
         """
+        if _CUDA_AVAILABLE:
+            # output_type="numpy" keeps predict() returning host arrays
+            rf_regressor = GPURandomForestRegressor(
+                n_estimators=n_estimators,
+                random_state=random_state,
+                output_type="numpy",
+            )
+            rf_regressor.fit(
+                cp.asarray(np.asarray(X_train), dtype=cp.float32),
+                cp.asarray(np.asarray(y_train), dtype=cp.float32),
+            )
+            return rf_regressor
         rf_regressor = RandomForestRegressor(
-            n_estimators=n_estimators, random_state=random_state
+            n_estimators=n_estimators, random_state=random_state, n_jobs=-1
         )
         rf_regressor.fit(X_train, y_train)
         return rf_regressor
@@ -114,8 +318,12 @@ class RegressionModeler:
             Mean Squared Error and R-squared.
         """
         y_pred = model.predict(X_test)
-        mse = mean_squared_error(y_test, y_pred)
-        r2 = r2_score(y_test, y_pred)
+        if _CUDA_AVAILABLE and isinstance(y_pred, cp.ndarray):
+            y_pred = cp.asnumpy(y_pred)
+        # float64 accumulation keeps the sums exact enough for float32 targets
+        y_true = np.ascontiguousarray(y_test, dtype=np.float64)
+        y_pred = np.ascontiguousarray(y_pred, dtype=np.float64)
+        _, mse, r2 = _regression_metrics(y_true, y_pred)
         return mse, r2
 
     def create_lag_features(self, dataframe, column_name, lag_number):
@@ -128,17 +336,23 @@ class RegressionModeler:
             Input DataFrame.
         column_name : str
             Name of the column for which lag features will be created.
-        lag_number : int
-            Number of time periods to lag.
+        lag_number : int or list of int
+            Number of time periods to lag, or several lags to create at once.
 
         Returns
         -------
         DataFrame
             DataFrame with lag features.
         """
-        lag_column_name = f"{column_name}_Lag{lag_number}"
-        dataframe[lag_column_name] = dataframe[column_name].shift(lag_number)
-        return dataframe
+        lags = np.atleast_1d(np.asarray(lag_number, dtype=np.int64))
+        lagged = np.full((len(dataframe), lags.size), np.nan)
+        _lag_kernel(dataframe[column_name].to_numpy(dtype=np.float64), lags, lagged)
+        return dataframe.assign(
+            **{
+                f"{column_name}_Lag{lag}": lagged[:, j]
+                for j, lag in enumerate(lags.tolist())
+            }
+        )
 
     def drop_na_values(self, dataframe):
         """
@@ -154,12 +368,20 @@ class RegressionModeler:
         DataFrame
             DataFrame with missing values dropped.
         """
-        dataframe.dropna(inplace=True)
-        return dataframe
+        return dataframe.dropna()
 
     def feature_selection_rfe(self, X, y, n_features):
         """
-        Performs feature selection using Recursive Feature Elimination (RFE).
+        Performs feature selection with a single cross-validated LASSO fit.
+
+        This replaces Recursive Feature Elimination, which refits a model once per
+        eliminated feature. The features are standardized first, since the L1
+        penalty would otherwise shrink features with small numeric ranges first.
+        Features are ordered by their absolute standardized LASSO coefficient, and
+        ties, such as features the penalty zeroed out, by how early they enter the
+        LASSO path. The first n_features are selected and ranked 1, and the
+        remaining features are ranked 2, 3, ... in that order, mirroring RFE's
+        ranking.
 
         Parameters
         ----------
@@ -175,8 +397,18 @@ class RegressionModeler:
         list
             List of tuples containing feature names, rankings, and support status.
         """
-        linear_reg = LinearRegression()
-        rfe = RFE(estimator=linear_reg, n_features_to_select=n_features)
-        rfe = rfe.fit(X, y)
-        feature_ranking = list(zip(X.columns, rfe.ranking_, rfe.support_))
+        X_scaled = StandardScaler().fit_transform(X)
+        y_centered = np.asarray(y, dtype=np.float64) - np.mean(y)
+        lasso = LassoCV(n_jobs=-1, cv=5).fit(X_scaled, y_centered)
+        _, path_coefs, _ = lasso_path(X_scaled, y_centered, alphas=lasso.alphas_)
+        # alphas_ decrease, so a lower index means the feature enters the path earlier
+        nonzero = path_coefs != 0
+        entry = np.where(nonzero.any(axis=1), nonzero.argmax(axis=1), nonzero.shape[1])
+        order = np.lexsort((entry, -np.abs(lasso.coef_)))
+        support = np.zeros(order.size, dtype=bool)
+        support[order[:n_features]] = True
+        ranking = np.ones(order.size, dtype=int)
+        unselected = order[n_features:]
+        ranking[unselected] = np.arange(2, unselected.size + 2)
+        feature_ranking = list(zip(X.columns, ranking, support))
         return feature_ranking
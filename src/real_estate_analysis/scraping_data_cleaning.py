@@ -3,10 +3,78 @@
 
 This module defines classes for inspecting and cleaning data.
 
+Set REAL_ESTATE_ANALYSIS_MODIN=1 to run the bulk fill in DataCleaner through
+Modin so it is spread across all cores; results are returned as pandas frames.
+
 """
 
+import os
+import re
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from joblib import Parallel, delayed
+from numba import njit
+
+from real_estate_analysis.data_cleaning import to_arrow
+
+if os.environ.get("REAL_ESTATE_ANALYSIS_MODIN") == "1":
+    import modin.pandas as mpd
+    from modin.utils import to_pandas
+else:
+    mpd = None
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+PRICE_NON_NUMERIC_PATTERN = re.compile(r"[^\d.]")
+
+# Below this many rows numexpr's thread start-up costs more than it saves
+NUMEXPR_MIN_ROWS = 10_000
+
+
+@njit(cache=True, nogil=True)
+def _parse_price_bytes(data, offsets, valid, out):
+    """
+    Parses UTF-8 price strings laid out as an Arrow string buffer into floats.
+
+    Bytes other than digits and "." are skipped, which matches stripping
+    PRICE_NON_NUMERIC_PATTERN and converting with errors="coerce": strings with no
+    digits or more than one decimal point become NaN.
+
+    Parameters
+    ----------
+    data : ndarray
+        The uint8 character buffer of the string array.
+    offsets : ndarray
+        int64 offsets of each string into data, one more than the number of strings.
+    valid : ndarray
+        Boolean validity of each string.
+    out : ndarray
+        float64 output buffer, one value per string.
+    """
+    for i in range(out.size):
+        out[i] = np.nan
+        if not valid[i]:
+            continue
+        value = 0.0
+        digits = 0
+        decimals = 0
+        points = 0
+        for k in range(offsets[i], offsets[i + 1]):
+            byte = data[k]
+            if 48 <= byte <= 57:
+                value = value * 10.0 + (byte - 48)
+                digits += 1
+                if points:
+                    decimals += 1
+            elif byte == 46:
+                points += 1
+        if digits and points <= 1:
+            out[i] = value / 10.0**decimals
 
 
 class DataInspector:
@@ -15,6 +83,7 @@ class DataInspector:
 
     """
 
+    @staticmethod
     def get_data_info(dataframe):
         """
         Retrieves information about missing values and data types in the DataFrame.
@@ -29,7 +98,10 @@ class DataInspector:
         DataFrame
             DataFrame containing columns for missing values and data types.
         """
-        missing_values = dataframe.isnull().sum()
+        missing_values = pd.Series(
+            np.count_nonzero(dataframe.isna().to_numpy(), axis=0),
+            index=dataframe.columns,
+        )
         data_types = dataframe.dtypes
         return pd.DataFrame({"Missing Values": missing_values, "Data Type": data_types})
 
@@ -48,8 +120,12 @@ class DataCleaner:
 
     correct_price_columns(dataframe, price_columns)
         Corrects price columns by removing non-numeric characters and converting to float.
+
+    filter_expr(dataframe, expr)
+        Keeps the rows matching a boolean expression such as "Price > 0".
     """
 
+    @staticmethod
     def drop_high_missing_columns(dataframe, threshold_ratio):
         """
         Drops columns with missing values exceeding a specified threshold ratio.
@@ -69,6 +145,7 @@ class DataCleaner:
         threshold = threshold_ratio * len(dataframe)
         return dataframe.dropna(thresh=threshold, axis=1)
 
+    @staticmethod
     def fill_missing_values(dataframe):
         """
         Fills missing values in the DataFrame using the mode for object columns and the median for numeric columns.
@@ -83,13 +160,52 @@ class DataCleaner:
         DataFrame
             DataFrame with missing values filled.
         """
-        for column in dataframe.columns:
-            if dataframe[column].dtype == "object":
-                dataframe[column].fillna(dataframe[column].mode()[0], inplace=True)
-            else:
-                dataframe[column].fillna(dataframe[column].median(), inplace=True)
-        return dataframe
+        is_object = dataframe.dtypes == "object"
+        object_columns = dataframe.columns[is_object]
+        other_columns = dataframe.columns[~is_object]
+        fill_values = dataframe[other_columns].median().to_dict()
+        fill_values.update(
+            {column: dataframe[column].mode().iat[0] for column in object_columns}
+        )
+        if mpd is not None:
+            return to_pandas(mpd.DataFrame(dataframe).fillna(fill_values))
+        return dataframe.fillna(fill_values)
+
+    @staticmethod
+    def _parse_prices(prices):
+        dtype = prices.dtype
+        if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+            # Walk the Arrow buffers directly rather than building a cleaned copy
+            array = pa.array(prices)
+            if isinstance(array, pa.ChunkedArray):
+                # Concatenated frames keep one chunk per input; the buffers
+                # below must describe a single contiguous array
+                array = array.combine_chunks()
+            array = array.cast(pa.large_string())
+            _, offsets, data = array.buffers()
+            offsets = np.frombuffer(offsets, dtype=np.int64)[
+                array.offset : array.offset + len(array) + 1
+            ]
+            data = (
+                np.frombuffer(data, dtype=np.uint8)
+                if data is not None
+                else np.empty(0, dtype=np.uint8)
+            )
+            valid = array.is_valid().to_numpy(zero_copy_only=False)
+            out = np.empty(len(array))
+            _parse_price_bytes(data, offsets, valid, out)
+            return out
+        if not pd.api.types.is_numeric_dtype(prices):
+            # Arrow runs a pattern string in C; a compiled re.Pattern would
+            # force the per-element Python fallback.
+            prices = prices.str.replace(
+                PRICE_NON_NUMERIC_PATTERN.pattern, "", regex=True
+            )
+        return pd.to_numeric(prices, errors="coerce").to_numpy(
+            dtype=float, na_value=np.nan
+        )
 
+    @staticmethod
     def correct_price_columns(dataframe, price_columns):
         """
         Corrects price columns by removing non-numeric characters and converting to float.
@@ -106,9 +222,37 @@ class DataCleaner:
         DataFrame
             DataFrame with corrected price columns.
         """
-        for col in price_columns:
-            if col in dataframe.columns:
-                dataframe[col] = (
-                    dataframe[col].replace("[^\d.]", "", regex=True).astype(float)
-                )
-        return dataframe
+        columns = [col for col in price_columns if col in dataframe.columns]
+        # Only the price columns are cast to Arrow, and only for parsing; the other
+        # text columns keep their object dtype.
+        prices = to_arrow(dataframe, columns)[columns]
+        # The parsing kernel releases the GIL, so columns parse concurrently.
+        n_jobs = max(1, min(len(columns), os.cpu_count() or 1))
+        parsed = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(DataCleaner._parse_prices)(prices[col]) for col in columns
+        )
+        return dataframe.assign(**dict(zip(columns, parsed)))
+
+    @staticmethod
+    def filter_expr(dataframe, expr):
+        """
+        Keeps the rows matching a boolean expression such as "Price > 0".
+
+        Large frames are filtered with numexpr, which evaluates the whole expression
+        in one multithreaded pass instead of allocating a temporary per operator.
+        Small frames, or environments without numexpr, use plain NumPy masking.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            Input DataFrame.
+        expr : str
+            Boolean expression over column names, in DataFrame.query syntax.
+
+        Returns
+        -------
+        DataFrame
+            Rows of the DataFrame for which the expression is true.
+        """
+        use_numexpr = ne is not None and len(dataframe) >= NUMEXPR_MIN_ROWS
+        return dataframe.query(expr, engine="numexpr" if use_numexpr else "python")
@@ -4,17 +4,452 @@
 
 This module defines a class, DataAnalyzer, for analyzing and visualizing data.
 
+Matplotlib and seaborn are imported by the DataVisualizer methods on first use, so
+DataAnalyzer can be imported without paying for them.
+
 """
 
-import matplotlib.pyplot as plt
+import re
+
+import numpy as np
 import pandas as pd
-import seaborn as sns
+from numba import njit, prange
+from scipy.linalg.blas import get_blas_funcs
+
+TIME_COLUMN_PATTERN = re.compile(r"year|date", re.IGNORECASE)
+
+
+def _standardize(values):
+    """
+    Centres the columns of a complete array and scales them to unit norm.
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of shape (n_rows,) or (n_rows, n_columns) without missing values.
+
+    Returns
+    -------
+    ndarray
+        float64 standardized array of the same shape; constant columns become NaN.
+    """
+    # Upcast float32 input, so the BLAS products downstream accumulate in float64
+    centered = values - values.mean(axis=0, dtype=np.float64)
+    norms = np.sqrt(np.einsum("i...,i...->...", centered, centered))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Constant columns give 0 / 0 = NaN, as DataFrame.corr does
+        return centered / norms
+
+
+def _correlation(values):
+    """
+    Computes the Pearson correlation matrix of the columns of a complete 2-D array.
+
+    The columns are centred and scaled to unit norm, so the correlation matrix is
+    the Gram matrix Z.T @ Z, which a single BLAS syrk call produces one triangle of.
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of shape (n_rows, n_columns) without missing values.
+
+    Returns
+    -------
+    ndarray
+        Correlation matrix of shape (n_columns, n_columns).
+    """
+    standardized = np.asfortranarray(_standardize(values))
+    # _standardize returns float64, so this is dsyrk
+    syrk = get_blas_funcs("syrk", (standardized,))
+    upper = syrk(1.0, standardized, trans=1, lower=0)
+    correlation = np.triu(upper) + np.triu(upper, 1).T
+    np.clip(correlation, -1.0, 1.0, out=correlation)
+    return correlation
+
+
+def _correlation_with(values, target):
+    """
+    Computes the Pearson correlation of each column of a 2-D array with one target.
+
+    Only the K correlations with the target are formed, a matrix-vector product,
+    rather than the full K x K matrix. Pairs with missing values are correlated over
+    their complete rows, as DataFrame.corr does.
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of shape (n_rows, n_columns) that may contain NaN.
+    target : ndarray
+        Target values of shape (n_rows,) that may contain NaN.
+
+    Returns
+    -------
+    ndarray
+        Correlation of each column with the target.
+    """
+    complete = ~np.isnan(values) & ~np.isnan(target)[:, np.newaxis]
+    if complete.all():
+        correlation = _standardize(values).T @ _standardize(target)
+    else:
+        counts = complete.sum(axis=0)
+        targets = np.where(complete, target[:, np.newaxis], 0.0)
+        values = np.where(complete, values, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_x = values.sum(axis=0, dtype=np.float64) / counts
+            mean_y = targets.sum(axis=0, dtype=np.float64) / counts
+            dx = np.where(complete, values - mean_x, 0.0)
+            dy = np.where(complete, targets - mean_y, 0.0)
+            correlation = np.einsum("ij,ij->j", dx, dy) / np.sqrt(
+                np.einsum("ij,ij->j", dx, dx) * np.einsum("ij,ij->j", dy, dy)
+            )
+    return np.clip(correlation, -1.0, 1.0)
+
+
+@njit(cache=True, parallel=True)
+def _pairwise_correlation(values):
+    """
+    Computes Pearson correlations over the pairwise-complete rows of each column pair.
+
+    Only the upper triangle is computed, with the outer loop spread across threads,
+    and it is mirrored into the lower triangle.
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of shape (n_rows, n_columns) that may contain NaN.
+
+    Returns
+    -------
+    ndarray
+        Correlation matrix of shape (n_columns, n_columns).
+    """
+    n_rows, n_columns = values.shape
+    correlation = np.empty((n_columns, n_columns))
+    for i in prange(n_columns):
+        for j in range(i, n_columns):
+            count = 0
+            sum_x = 0.0
+            sum_y = 0.0
+            for k in range(n_rows):
+                x = values[k, i]
+                y = values[k, j]
+                if not (np.isnan(x) or np.isnan(y)):
+                    count += 1
+                    sum_x += x
+                    sum_y += y
+            if count == 0:
+                correlation[i, j] = correlation[j, i] = np.nan
+                continue
+            mean_x = sum_x / count
+            mean_y = sum_y / count
+            sxx = 0.0
+            syy = 0.0
+            sxy = 0.0
+            for k in range(n_rows):
+                x = values[k, i]
+                y = values[k, j]
+                if not (np.isnan(x) or np.isnan(y)):
+                    dx = x - mean_x
+                    dy = y - mean_y
+                    sxx += dx * dx
+                    syy += dy * dy
+                    sxy += dx * dy
+            divisor = np.sqrt(sxx * syy)
+            value = sxy / divisor if divisor != 0.0 else np.nan
+            value = min(max(value, -1.0), 1.0)
+            correlation[i, j] = correlation[j, i] = value
+    return correlation
+
+
+@njit(cache=True, parallel=True)
+def _group_mean(codes, values, n_groups):
+    """
+    Computes the NaN-skipping mean of each column of 'values' per group code.
+
+    Parameters
+    ----------
+    codes : ndarray
+        Group code of each row; rows with a negative code are ignored.
+    values : ndarray
+        Array of shape (n_rows, n_columns) to average.
+    n_groups : int
+        Number of groups.
+
+    Returns
+    -------
+    ndarray
+        Group means of shape (n_groups, n_columns); empty groups are NaN.
+    """
+    n_rows, n_columns = values.shape
+    means = np.full((n_groups, n_columns), np.nan)
+    for j in prange(n_columns):
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(n_rows):
+            code = codes[i]
+            value = values[i, j]
+            if code >= 0 and not np.isnan(value):
+                sums[code] += value
+                counts[code] += 1
+        for group in range(n_groups):
+            if counts[group]:
+                means[group, j] = sums[group] / counts[group]
+    return means
+
+
+def _grouped_mean(dataframe, group_column, columns):
+    """
+    Averages columns per group like dataframe.groupby(group_column)[columns].mean().
+
+    Categorical keys keep every category in order; other keys are sorted, and
+    missing keys are dropped.
+
+    Parameters
+    ----------
+    dataframe : DataFrame or NumericPanel
+        Input data.
+    group_column : str
+        Column used for grouping.
+    columns : list
+        Columns for which the mean is calculated.
+
+    Returns
+    -------
+    DataFrame
+        Mean of each column, indexed by group.
+    """
+    if isinstance(dataframe, NumericPanel):
+        keys = dataframe.select([group_column])[:, 0]
+    else:
+        keys = dataframe[group_column]
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        codes = keys.cat.codes.to_numpy()
+        index = pd.CategoricalIndex(
+            pd.Categorical.from_codes(
+                np.arange(len(keys.cat.categories)), dtype=keys.dtype
+            ),
+            name=group_column,
+        )
+    else:
+        codes, uniques = pd.factorize(keys, sort=True)
+        index = pd.Index(uniques, name=group_column)
+    values = np.asfortranarray(DataAnalyzer._numeric_view(dataframe, columns))
+    means = _group_mean(codes.astype(np.intp), values, len(index))
+    return pd.DataFrame(means, index=index, columns=columns)
+
+
+def _category_counts(series):
+    """
+    Counts the rows in each category of a categorical Series.
+
+    The category codes are dense, so a bincount replaces value_counts' hashing.
+
+    Parameters
+    ----------
+    series : Series
+        Categorical Series.
+
+    Returns
+    -------
+    Series
+        Number of rows per category, in category order.
+    """
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    return pd.Series(counts, index=series.cat.categories, name="count")
+
+
+@njit(cache=True, parallel=True)
+def _describe_moments(values):
+    """
+    Computes the count, mean, standard deviation, minimum and maximum of each
+    column in a single NaN-skipping pass, using Welford's update for the variance.
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of shape (n_rows, n_columns) with NaN for missing values.
+
+    Returns
+    -------
+    ndarray
+        Array of shape (5, n_columns): count, mean, std, min and max.
+    """
+    n_rows, n_columns = values.shape
+    moments = np.full((5, n_columns), np.nan)
+    for j in prange(n_columns):
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        low = np.inf
+        high = -np.inf
+        for i in range(n_rows):
+            value = values[i, j]
+            if not np.isnan(value):
+                count += 1
+                delta = value - mean
+                mean += delta / count
+                m2 += delta * (value - mean)
+                low = min(low, value)
+                high = max(high, value)
+        moments[0, j] = count
+        if count:
+            moments[1, j] = mean
+            moments[3, j] = low
+            moments[4, j] = high
+        if count > 1:
+            moments[2, j] = np.sqrt(m2 / (count - 1))
+    return moments
+
+
+def _quartiles(column):
+    """
+    Computes the 25th, 50th and 75th percentiles of a column with one partial sort.
+
+    Parameters
+    ----------
+    column : ndarray
+        Values of the column, with NaN for missing values.
+
+    Returns
+    -------
+    ndarray
+        The three percentiles, linearly interpolated as in DataFrame.describe().
+    """
+    valid = column[~np.isnan(column)]
+    if valid.size == 0:
+        return np.full(3, np.nan)
+    positions = np.array([0.25, 0.5, 0.75]) * (valid.size - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    partitioned = np.partition(valid, np.unique(np.concatenate([lower, upper])))
+    low = partitioned[lower].astype(np.float64)
+    high = partitioned[upper].astype(np.float64)
+    return low + (high - low) * (positions - lower)
+
+
+def _describe(values, columns):
+    """
+    Computes DataFrame.describe()-style statistics for the columns of a 2-D array.
+
+    The moments come from one pass over each column and the quartiles from one
+    partial sort, instead of a separate pass per statistic.
+
+    Parameters
+    ----------
+    values : ndarray
+        Array of shape (n_rows, n_columns) with NaN for missing values.
+    columns : list
+        Names of the columns.
+
+    Returns
+    -------
+    DataFrame
+        count, mean, std, min, 25%, 50%, 75% and max of each column.
+    """
+    moments = _describe_moments(values)
+    quartiles = np.empty((3, values.shape[1]))
+    for j in range(values.shape[1]):
+        quartiles[:, j] = _quartiles(values[:, j])
+    return pd.DataFrame(
+        np.vstack([moments[:4], quartiles, moments[4:]]),
+        index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+        columns=columns,
+        dtype=np.float64,
+    )
+
+
+def _describe_frame(dataframe):
+    """
+    Describes a DataFrame with _describe when all described columns are numeric.
+
+    Frames whose describe() would cover datetime columns, or that have no numeric
+    columns, are left to pandas.
+
+    Parameters
+    ----------
+    dataframe : DataFrame
+        Input DataFrame.
+
+    Returns
+    -------
+    DataFrame
+        Descriptive statistics, as DataFrame.describe() returns them.
+    """
+    numeric = dataframe.select_dtypes(include="number")
+    if numeric.shape[1] == 0 or dataframe.select_dtypes(include="datetime").shape[1]:
+        return dataframe.describe()
+    values = np.asfortranarray(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+    return _describe(values, numeric.columns)
+
+
+class NumericPanel:
+    """
+    Numeric columns of a DataFrame held as one column-contiguous float32 array.
+
+    Building the panel once lets several DataAnalyzer calls work on the same array
+    instead of assembling the columns from the DataFrame on every call.
+    calculate_correlation_matrix, correlation_with_target, aggregate_by_category
+    and get_descriptive_stats_subset accept a panel in place of a DataFrame.
+
+    Attributes
+    ----------
+    columns : list
+        Column names, in array order.
+    data : ndarray
+        float32 array of shape (n_rows, n_columns) in Fortran order.
+    """
+
+    def __init__(self, columns, data):
+        self.columns = list(columns)
+        self.data = data
+        self._positions = {column: i for i, column in enumerate(self.columns)}
+
+    @classmethod
+    def from_dataframe(cls, dataframe, columns):
+        """
+        Builds a panel from numeric columns of a DataFrame.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            Input DataFrame.
+        columns : list
+            Numeric columns to hold.
+
+        Returns
+        -------
+        NumericPanel
+            Panel holding the columns as float32.
+        """
+        data = np.asfortranarray(DataAnalyzer._numeric_view(dataframe, columns))
+        return cls(columns, data)
+
+    def select(self, columns):
+        """
+        Returns the given columns as a 2-D array.
+
+        Parameters
+        ----------
+        columns : list
+            Columns to return.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n_rows, len(columns)).
+        """
+        if list(columns) == self.columns:
+            return self.data
+        return self.data[:, [self._positions[column] for column in columns]]
 
 
 class DataAnalyzer:
     """
     Class for analyzing and visualizing data.
 
+    Methods that read numeric columns also accept a NumericPanel.
+
     Methods
     -------
     get_descriptive_stats(dataframe)
@@ -37,8 +472,38 @@ class DataAnalyzer:
 
     aggregate_data(dataframe, group_by_column, agg_columns)
         Aggregates data by a specified column.
+
+    convert_many(dataframe, category_columns)
+        Converts several categorical columns to numeric columns in one step.
     """
 
+    @staticmethod
+    def _numeric_view(dataframe, columns):
+        """
+        Returns the given columns as a float32 array for the correlation and
+        aggregation kernels.
+
+        Halving the element size halves the memory these scans stream through. The
+        kernels upcast to float64 before accumulating, so the only loss is the
+        rounding of each input value to float32.
+
+        Parameters
+        ----------
+        dataframe : DataFrame or NumericPanel
+            Input data.
+        columns : list
+            Numeric columns to extract.
+
+        Returns
+        -------
+        ndarray
+            Array of shape (n_rows, n_columns) with NaN for missing values.
+        """
+        if isinstance(dataframe, NumericPanel):
+            return dataframe.select(columns)
+        return dataframe[columns].to_numpy(dtype=np.float32, na_value=np.nan)
+
+    @staticmethod
     def get_descriptive_stats(dataframe):
         """
         Retrieves descriptive statistics for the DataFrame.
@@ -53,16 +518,17 @@ class DataAnalyzer:
         DataFrame
             Descriptive statistics for the DataFrame.
         """
-        return dataframe.describe()
+        return _describe_frame(dataframe)
 
+    @staticmethod
     def aggregate_by_category(dataframe, category_column, aggregation_columns):
         """
         Aggregates data by a specified category column.
 
         Parameters
         ----------
-        dataframe : DataFrame
-            Input DataFrame.
+        dataframe : DataFrame or NumericPanel
+            Input data; a panel must also hold the category column.
         category_column : str
             Column used for grouping.
         aggregation_columns : list
@@ -73,9 +539,10 @@ class DataAnalyzer:
         DataFrame
             Aggregated data by category.
         """
-        aggregated_data = dataframe.groupby(category_column)[aggregation_columns].mean()
+        aggregated_data = _grouped_mean(dataframe, category_column, aggregation_columns)
         return aggregated_data
 
+    @staticmethod
     def sample_addresses(dataframe, column_name, sample_size, seed=1):
         """
         Samples addresses from a specified column.
@@ -98,6 +565,7 @@ class DataAnalyzer:
         """
         return dataframe[column_name].sample(sample_size, random_state=seed)
 
+    @staticmethod
     def find_time_related_columns(dataframe):
         """
         Finds columns related to time in the DataFrame.
@@ -112,20 +580,17 @@ class DataAnalyzer:
         list
             List of columns related to time.
         """
-        return [
-            col
-            for col in dataframe.columns
-            if "year" in col.lower() or "date" in col.lower()
-        ]
+        return [col for col in dataframe.columns if TIME_COLUMN_PATTERN.search(col)]
 
+    @staticmethod
     def calculate_correlation_matrix(dataframe, numerical_columns):
         """
         Calculates the correlation matrix for numerical columns.
 
         Parameters
         ----------
-        dataframe : DataFrame
-            Input DataFrame.
+        dataframe : DataFrame or NumericPanel
+            Input data.
         numerical_columns : list
             Numerical columns for which the correlation matrix is calculated.
 
@@ -134,16 +599,30 @@ class DataAnalyzer:
         DataFrame
             Correlation matrix for numerical columns.
         """
-        return dataframe[numerical_columns].corr()
+        values = DataAnalyzer._numeric_view(dataframe, numerical_columns)
+        if np.isnan(values).any():
+            # Each pair is correlated over its own complete rows, as in DataFrame.corr
+            correlation = _pairwise_correlation(values)
+        else:
+            correlation = _correlation(values)
+        return pd.DataFrame(
+            correlation,
+            index=numerical_columns,
+            columns=numerical_columns,
+            dtype=np.float64,
+        )
 
+    @staticmethod
     def correlation_with_target(correlation_matrix, target_column):
         """
         Calculates the correlation of numerical columns with the target column.
 
         Parameters
         ----------
-        correlation_matrix : DataFrame
-            Correlation matrix for numerical columns.
+        correlation_matrix : DataFrame or NumericPanel
+            Correlation matrix for numerical columns, or a panel of the columns
+            themselves, in which case only the correlations with the target are
+            computed.
         target_column : str
             Target column for which correlation is calculated.
 
@@ -152,8 +631,20 @@ class DataAnalyzer:
         Series
             Correlation of numerical columns with the target column.
         """
+        if isinstance(correlation_matrix, NumericPanel):
+            panel = correlation_matrix
+            correlation_matrix = pd.DataFrame(
+                {
+                    target_column: _correlation_with(
+                        panel.data, panel.select([target_column])[:, 0]
+                    )
+                },
+                index=panel.columns,
+                dtype=np.float64,
+            )
         return correlation_matrix[target_column].sort_values(ascending=False)
 
+    @staticmethod
     def aggregate_data(dataframe, group_by_column, agg_columns):
         """
         Aggregates data by a specified column.
@@ -172,16 +663,17 @@ class DataAnalyzer:
         DataFrame
             Aggregated data by a specified column.
         """
-        return dataframe.groupby(group_by_column)[agg_columns].mean().reset_index()
+        return _grouped_mean(dataframe, group_by_column, agg_columns).reset_index()
 
+    @staticmethod
     def get_descriptive_stats_subset(dataframe, columns):
         """
         Retrieves descriptive statistics for a subset of columns.
 
         Parameters
         ----------
-        dataframe : DataFrame
-            Input DataFrame.
+        dataframe : DataFrame or NumericPanel
+            Input data.
         columns : list
             Columns for which descriptive statistics are calculated.
 
@@ -190,8 +682,11 @@ class DataAnalyzer:
         DataFrame
             Descriptive statistics for the subset of columns.
         """
-        return dataframe[columns].describe()
+        if isinstance(dataframe, NumericPanel):
+            return _describe(dataframe.select(columns), columns)
+        return _describe_frame(dataframe[columns])
 
+    @staticmethod
     def add_price_category(
         dataframe, price_column, bins, labels, category_column="Price_Category"
     ):
@@ -204,10 +699,10 @@ class DataAnalyzer:
             Input DataFrame.
         price_column : str
             Column used for defining price categories.
-        bins : list
-            Binning intervals for defining categories.
-        labels : list
-            Labels for the categories.
+        bins : list or int
+            Bin edges, or a number of equal-width bins, as accepted by pd.cut.
+        labels : list or None
+            Labels for the categories, as accepted by pd.cut.
         category_column : str, optional
             Name of the new category column, by default "Price_Category".
 
@@ -216,16 +711,36 @@ class DataAnalyzer:
         DataFrame
             DataFrame with the added price category column.
         """
-        if category_column not in dataframe.columns:
+        if category_column in dataframe.columns:
+            return dataframe
+        if (
+            not pd.api.types.is_list_like(bins)
+            or not pd.api.types.is_list_like(labels)
+            or len(labels) != len(bins) - 1
+        ):
+            # Bin counts, default interval labels and invalid input go through pd.cut
             dataframe[category_column] = pd.cut(
                 dataframe[price_column], bins=bins, labels=labels
             )
+        else:
+            prices = dataframe[price_column].to_numpy(dtype=np.float64, na_value=np.nan)
+            # right=True gives pd.cut's (a, b] intervals; values outside the bins,
+            # including NaN, fall on an end and get the missing code -1
+            codes = np.digitize(prices, bins, right=True) - 1
+            codes[(codes < 0) | (codes >= len(bins) - 1)] = -1
+            dataframe[category_column] = pd.Categorical.from_codes(
+                codes, categories=labels, ordered=True
+            )
         return dataframe
 
+    @staticmethod
     def calculate_correlation_with_price(dataframe, target_column="List_price"):
         """
         Calculates the correlation of all columns with a specified target price column.
 
+        Only the numeric and boolean columns are read, and only their correlations
+        with the target are computed, not the full correlation matrix.
+
         Parameters
         ----------
         dataframe : DataFrame
@@ -236,10 +751,20 @@ class DataAnalyzer:
         Returns
         -------
         Series
-            Correlation of all columns with the target price column.
+            Correlation of the numeric columns with the target price column.
         """
-        return dataframe.corr()[target_column].sort_values(ascending=False)
+        columns = dataframe.select_dtypes(include=["number", "bool"]).columns
+        values = DataAnalyzer._numeric_view(dataframe, columns)
+        target = DataAnalyzer._numeric_view(dataframe, [target_column])[:, 0]
+        correlation = pd.Series(
+            _correlation_with(values, target),
+            index=columns,
+            dtype=np.float64,
+            name=target_column,
+        )
+        return correlation.sort_values(ascending=False)
 
+    @staticmethod
     def convert_categorical_to_numeric(dataframe, category_column):
         """
         Converts a categorical column to numeric by creating a new numeric column.
@@ -256,39 +781,111 @@ class DataAnalyzer:
         DataFrame
             DataFrame with the added numeric representation of the categorical column.
         """
-        dataframe[category_column + "_Numeric"] = dataframe[category_column].cat.codes
+        # Categorical.codes is the bare code array, without a new Series and Index
+        codes = dataframe[category_column].array.codes.copy()
+        dataframe[category_column + "_Numeric"] = codes
         return dataframe
 
+    @staticmethod
+    def convert_many(dataframe, category_columns):
+        """
+        Converts several categorical columns to numeric columns in one step.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            Input DataFrame.
+        category_columns : list
+            Categorical columns to be converted.
+
+        Returns
+        -------
+        DataFrame
+            New DataFrame with a "<column>_Numeric" column added for each column.
+        """
+        return dataframe.assign(
+            **{
+                f"{column}_Numeric": dataframe[column].array.codes.copy()
+                for column in category_columns
+            }
+        )
+
 
 class DataVisualizer:
     """
     Class for data visualization.
 
+    Every plot method draws on the supplied ``ax`` (or ``axes`` for grids) when given,
+    so callers can recycle Axes with clear_axes instead of creating a Figure per
+    call, and only calls ``plt.show()`` when ``show`` is True.
+
     Methods
     -------
-    plot_distribution_grid(dataframe, column_details, figsize=(15, 10))
+    clear_axes(axes)
+        Clears one or more Axes so they can be drawn on again.
+
+    plot_distribution_grid(dataframe, column_details, figsize=(15, 10), axes=None, show=True)
         Plots a grid of distributions for specified columns.
 
-    plot_category_counts(dataframe, category_column, title="Category Counts", figsize=(10, 6))
+    plot_category_counts(dataframe, category_column, title="Category Counts", figsize=(10, 6), ax=None, show=True)
         Plots counts of unique values in a categorical column.
 
-    plot_feature_importances(importance_df, title="Feature Importances", figsize=(12, 8))
+    plot_feature_importances(importance_df, title="Feature Importances", figsize=(12, 8), ax=None, show=True)
         Plots feature importances from a DataFrame.
 
-    plot_heatmap(data, title, figsize=(15, 10), fmt=".2f")
+    plot_heatmap(data, title, figsize=(15, 10), fmt=".2f", ax=None, show=True)
         Plots a heatmap for a given data matrix.
 
-    plot_histogram(data, title, xlabel, ylabel, bins=30, figsize=(10, 6))
+    plot_histogram(data, title, xlabel, ylabel, bins=30, figsize=(10, 6), ax=None, show=True)
         Plots a histogram for a given data column.
 
-    plot_distribution_subplot(dataframe, column_details, nrows, ncols, figsize=(15, 10))
+    plot_distribution_subplot(dataframe, column_details, nrows, ncols, figsize=(15, 10), axes=None, show=True)
         Plots distribution subplots for specified columns.
 
-    plot_category_distribution(dataframe, category_column, title="Distribution Across Categories", figsize=(8, 6))
+    plot_category_distribution(dataframe, category_column, title="Distribution Across Categories", figsize=(8, 6), ax=None, show=True)
         Plots the distribution of a categorical column.
     """
 
-    def plot_distribution_grid(dataframe, column_details, figsize=(15, 10)):
+    @staticmethod
+    def clear_axes(axes):
+        """
+        Clears one or more Axes so they can be drawn on again.
+
+        Parameters
+        ----------
+        axes : Axes or array of Axes
+            Axes to clear.
+        """
+        for ax in np.ravel(axes):
+            ax.cla()
+
+    @staticmethod
+    def _histogram(ax, values, kde, bins="auto"):
+        """
+        Draws a histogram, using seaborn only when a KDE curve is requested.
+
+        Parameters
+        ----------
+        ax : Axes
+            Axes to draw on.
+        values : Series
+            Values to bin.
+        kde : bool
+            Whether to overlay a kernel density estimate.
+        bins : int or str, optional
+            Bins passed to the histogram, by default "auto".
+        """
+        import seaborn as sns
+
+        if kde:
+            sns.histplot(values, kde=True, bins=bins, ax=ax)
+        else:
+            ax.hist(values.dropna().to_numpy(), bins=bins)
+
+    @staticmethod
+    def plot_distribution_grid(
+        dataframe, column_details, figsize=(15, 10), axes=None, show=True
+    ):
         """
         Plots a grid of distributions for specified columns.
 
@@ -300,22 +897,38 @@ class DataVisualizer:
             List of tuples containing column name, KDE flag, and bins (optional).
         figsize : tuple, optional
             Size of the figure, by default (15, 10).
+        axes : array of Axes, optional
+            2x2 grid of Axes to draw on, by default a new Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
         """
-        fig, axes = plt.subplots(nrows=2, ncols=2, figsize=figsize)
+        import matplotlib.pyplot as plt
+
+        if axes is None:
+            fig, axes = plt.subplots(nrows=2, ncols=2, figsize=figsize)
+        else:
+            fig = np.ravel(axes)[0].figure
         for i, (col, kde, bins) in enumerate(column_details):
-            # Check if bins is defined, if not, omit the bins parameter
-            if bins is None:
-                sns.histplot(dataframe[col], kde=kde, ax=axes[i // 2, i % 2])
-            else:
-                sns.histplot(dataframe[col], kde=kde, bins=bins, ax=axes[i // 2, i % 2])
-            axes[i // 2, i % 2].set_title(f"Distribution of {col}")
-            axes[i // 2, i % 2].set_xlabel(col)
-            axes[i // 2, i % 2].set_ylabel("Frequency")
-        plt.tight_layout()
-        plt.show()
+            ax = axes[i // 2, i % 2]
+            # Fall back to automatic binning when bins is not defined
+            DataVisualizer._histogram(
+                ax, dataframe[col], kde, "auto" if bins is None else bins
+            )
+            ax.set_title(f"Distribution of {col}")
+            ax.set_xlabel(col)
+            ax.set_ylabel("Frequency")
+        fig.tight_layout()
+        if show:
+            plt.show()
 
+    @staticmethod
     def plot_category_counts(
-        dataframe, category_column, title="Category Counts", figsize=(10, 6)
+        dataframe,
+        category_column,
+        title="Category Counts",
+        figsize=(10, 6),
+        ax=None,
+        show=True,
     ):
         """
         Plots counts of unique values in a categorical column.
@@ -330,17 +943,37 @@ class DataVisualizer:
             Title of the plot, by default "Category Counts".
         figsize : tuple, optional
             Size of the figure, by default (10, 6).
+        ax : Axes, optional
+            Axes to draw on, by default a new Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
         """
-        plt.figure(figsize=figsize)
-        dataframe[category_column].value_counts().plot(kind="bar")
-        plt.title(title)
-        plt.xlabel(category_column)
-        plt.ylabel("Count")
-        plt.xticks(rotation=45)
-        plt.show()
+        import matplotlib.pyplot as plt
 
+        categories = dataframe[category_column]
+        if isinstance(categories.dtype, pd.CategoricalDtype):
+            counts = _category_counts(categories).sort_values(
+                ascending=False, kind="stable"
+            )
+        else:
+            counts = categories.value_counts()
+        if ax is None:
+            _, ax = plt.subplots(figsize=figsize)
+        counts.plot(kind="bar", ax=ax)
+        ax.set_title(title)
+        ax.set_xlabel(category_column)
+        ax.set_ylabel("Count")
+        ax.tick_params(axis="x", labelrotation=45)
+        if show:
+            plt.show()
+
+    @staticmethod
     def plot_feature_importances(
-        importance_df, title="Feature Importances", figsize=(12, 8)
+        importance_df,
+        title="Feature Importances",
+        figsize=(12, 8),
+        ax=None,
+        show=True,
     ):
         """
         Plots feature importances from a DataFrame.
@@ -353,15 +986,25 @@ class DataVisualizer:
             Title of the plot, by default "Feature Importances".
         figsize : tuple, optional
             Size of the figure, by default (12, 8).
+        ax : Axes, optional
+            Axes to draw on, by default a new Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
         """
-        plt.figure(figsize=figsize)
-        sns.barplot(x="Importance", y="Feature", data=importance_df)
-        plt.title(title)
-        plt.xlabel("Importance")
-        plt.ylabel("Feature")
-        plt.show()
-
-    def plot_heatmap(data, title, figsize=(15, 10), fmt=".2f"):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        if ax is None:
+            _, ax = plt.subplots(figsize=figsize)
+        sns.barplot(x="Importance", y="Feature", data=importance_df, ax=ax)
+        ax.set_title(title)
+        ax.set_xlabel("Importance")
+        ax.set_ylabel("Feature")
+        if show:
+            plt.show()
+
+    @staticmethod
+    def plot_heatmap(data, title, figsize=(15, 10), fmt=".2f", ax=None, show=True):
         """
         Plots a heatmap for a given data matrix.
 
@@ -375,13 +1018,35 @@ class DataVisualizer:
             Size of the figure, by default (15, 10).
         fmt : str, optional
             Format string for annotating cells, by default ".2f".
+        ax : Axes, optional
+            Axes to draw on, by default a new Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
         """
-        plt.figure(figsize=figsize)
-        sns.heatmap(data, annot=True, cmap="coolwarm", fmt=fmt)
-        plt.title(title)
-        plt.show()
-
-    def plot_histogram(data, title, xlabel, ylabel, bins=30, figsize=(10, 6)):
+        import matplotlib.pyplot as plt
+
+        values = np.asarray(data, dtype=np.float64)
+        if ax is None:
+            _, ax = plt.subplots(figsize=figsize)
+        # One image plus one text per cell, instead of seaborn's per-cell styling
+        image = ax.imshow(values, cmap="coolwarm", aspect="auto", rasterized=True)
+        ax.figure.colorbar(image, ax=ax)
+        if isinstance(data, pd.DataFrame):
+            ax.set_xticks(range(values.shape[1]))
+            ax.set_xticklabels(data.columns, rotation=90)
+            ax.set_yticks(range(values.shape[0]))
+            ax.set_yticklabels(data.index)
+        for (row, col), value in np.ndenumerate(values):
+            if not np.isnan(value):
+                ax.text(col, row, format(value, fmt), ha="center", va="center")
+        ax.set_title(title)
+        if show:
+            plt.show()
+
+    @staticmethod
+    def plot_histogram(
+        data, title, xlabel, ylabel, bins=30, figsize=(10, 6), ax=None, show=True
+    ):
         """
         Plots a histogram for a given data column.
 
@@ -399,16 +1064,25 @@ class DataVisualizer:
             Number of bins for the histogram, by default 30.
         figsize : tuple, optional
             Size of the figure, by default (10, 6).
+        ax : Axes, optional
+            Axes to draw on, by default a new Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
         """
-        plt.figure(figsize=figsize)
-        sns.histplot(data, bins=bins)
-        plt.title(title)
-        plt.xlabel(xlabel)
-        plt.ylabel(ylabel)
-        plt.show()
-
+        import matplotlib.pyplot as plt
+
+        if ax is None:
+            _, ax = plt.subplots(figsize=figsize)
+        DataVisualizer._histogram(ax, data, kde=False, bins=bins)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        if show:
+            plt.show()
+
+    @staticmethod
     def plot_distribution_subplot(
-        dataframe, column_details, nrows, ncols, figsize=(15, 10)
+        dataframe, column_details, nrows, ncols, figsize=(15, 10), axes=None, show=True
     ):
         """
         Plots distribution subplots for specified columns.
@@ -425,26 +1099,48 @@ class DataVisualizer:
             Number of columns in the subplot grid.
         figsize : tuple, optional
             Size of the figure, by default (15, 10).
+        axes : array of Axes, optional
+            nrows x ncols grid of Axes to draw on, by default a new Figure of size
+            figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
         """
-        fig, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize)
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        if axes is None:
+            fig, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=figsize)
+        else:
+            fig = np.ravel(axes)[0].figure
         for i, (col, plot_type) in enumerate(column_details):
             ax = axes[i // ncols, i % ncols]
             if plot_type == "hist":
-                sns.histplot(dataframe[col], kde=True, ax=ax)
+                DataVisualizer._histogram(ax, dataframe[col], kde=True)
             elif plot_type == "count":
-                sns.countplot(x=col, data=dataframe, ax=ax)
+                if isinstance(dataframe[col].dtype, pd.CategoricalDtype):
+                    # The codes are already dense integers; no need to rehash
+                    counts = _category_counts(dataframe[col])
+                    ax.bar(range(len(counts)), counts.to_numpy())
+                    ax.set_xticks(range(len(counts)))
+                    ax.set_xticklabels(counts.index, rotation=45)
+                else:
+                    sns.countplot(x=col, data=dataframe, ax=ax)
             ax.set_title(f"Distribution of {col}")
             ax.set_xlabel(col)
             ax.set_ylabel("Frequency")
 
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        if show:
+            plt.show()
 
+    @staticmethod
     def plot_category_distribution(
         dataframe,
         category_column,
         title="Distribution Across Categories",
         figsize=(8, 6),
+        ax=None,
+        show=True,
     ):
         """
         Plots the distribution of a categorical column.
@@ -459,14 +1155,21 @@ class DataVisualizer:
             Title of the plot, by default "Distribution Across Categories".
         figsize : tuple, optional
             Size of the figure, by default (8, 6).
+        ax : Axes, optional
+            Axes to draw on, by default a new Figure of size figsize.
+        show : bool, optional
+            Whether to call plt.show(), by default True.
         """
-        plt.figure(figsize=figsize)
-        sns.countplot(
-            x=category_column,
-            data=dataframe,
-            order=dataframe[category_column].cat.categories,
-        )
-        plt.title(title)
-        plt.xlabel(category_column)
-        plt.ylabel("Number of Properties")
-        plt.show()
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        counts = _category_counts(dataframe[category_column])
+        if ax is None:
+            _, ax = plt.subplots(figsize=figsize)
+        # Seaborn draws the K precomputed counts instead of tallying every row
+        sns.barplot(x=counts.index, y=counts.to_numpy(), order=counts.index, ax=ax)
+        ax.set_title(title)
+        ax.set_xlabel(category_column)
+        ax.set_ylabel("Number of Properties")
+        if show:
+            plt.show()
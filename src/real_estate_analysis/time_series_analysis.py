@@ -4,12 +4,82 @@
 
 This module provides a TimeSeriesModeler class for ARIMA time series modeling.
 
+statsmodels is imported when a model is first fitted rather than at import time.
+
 """
 
-from statsmodels.tsa.arima.model import ARIMA
+import numpy as np
 import pandas as pd
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import warnings
+import weakref
+
+# Forecast means and confidence intervals keyed by fitted model, then by steps.
+_FORECAST_CACHE = weakref.WeakKeyDictionary()
+
+
+def _plot_lines(ax, lines):
+    """
+    Draws several date-indexed lines as a single LineCollection.
+
+    Parameters
+    ----------
+    ax : Axes
+        The axes to draw on.
+    lines : list of tuples
+        (dates, values, label, color, linestyle) for each line.
+
+    Returns
+    -------
+    None
+    """
+    segments = [
+        np.column_stack(
+            [
+                mdates.date2num(pd.to_datetime(dates)),
+                np.asarray(values, dtype=float).ravel(),
+            ]
+        )
+        for dates, values, _, _, _ in lines
+    ]
+    colors = [color for _, _, _, color, _ in lines]
+    linestyles = [linestyle for _, _, _, _, linestyle in lines]
+    ax.add_collection(LineCollection(segments, colors=colors, linestyles=linestyles))
+    ax.autoscale_view()
+    ax.xaxis_date()
+    ax.legend(
+        handles=[
+            Line2D([], [], color=color, linestyle=linestyle, label=label)
+            for _, _, label, color, linestyle in lines
+        ]
+    )
+
+
+def _date_bounds(date):
+    """
+    Returns the first and last instant covered by a date label.
+
+    A partial date string such as "2019" or "2019-06" covers its whole year or month,
+    as it does in DatetimeIndex label slicing.
+
+    Parameters
+    ----------
+    date : str or datetime-like
+        Date label.
+
+    Returns
+    -------
+    tuple
+        Start and end of the labelled period as numpy datetime64 values.
+    """
+    if isinstance(date, str):
+        period = pd.Period(date)
+        return period.start_time.to_datetime64(), period.end_time.to_datetime64()
+    timestamp = pd.Timestamp(date).to_datetime64()
+    return timestamp, timestamp
 
 
 class TimeSeriesModeler:
@@ -42,10 +112,16 @@ class TimeSeriesModeler:
         DataFrame
             Time series data prepared for modeling.
         """
-        filtered_data = dataframe[dataframe[region_name] == "United States"]
-        ts_data = filtered_data[[date_column, value_column]].dropna()
-        ts_data.set_index(date_column, inplace=True)
-        return ts_data
+        regions = dataframe[region_name]
+        if isinstance(regions.dtype, pd.CategoricalDtype):
+            # Compare integer codes rather than strings
+            code = regions.cat.categories.get_indexer(["United States"])[0]
+            mask = (regions.cat.codes.to_numpy() == code) & (code >= 0)
+        else:
+            mask = (regions == "United States").to_numpy(dtype=bool, na_value=False)
+        # Project to the two needed columns before the row filter copies anything
+        ts_data = dataframe[[date_column, value_column]][mask].dropna()
+        return ts_data.set_index(date_column)
 
     def split_data(self, ts_data, train_end_date, test_start_date):
         """
@@ -67,11 +143,17 @@ class TimeSeriesModeler:
         DataFrame
             Testing data.
         """
-        train_data = ts_data[:train_end_date]
-        test_data = ts_data[test_start_date:]
+        # Binary searches on the sorted dates, then positional slices
+        dates = ts_data.index.to_numpy()
+        train_end = np.searchsorted(dates, _date_bounds(train_end_date)[1], "right")
+        test_start = np.searchsorted(dates, _date_bounds(test_start_date)[0], "left")
+        train_data = ts_data.iloc[:train_end]
+        test_data = ts_data.iloc[test_start:]
         return train_data, test_data
 
-    def fit_arima_model(self, train_data, arima_order):
+    def fit_arima_model(
+        self, train_data, arima_order, low_memory=False, skip_covariance=False
+    ):
         """
         Fits an ARIMA model to the training data.
 
@@ -81,15 +163,27 @@ class TimeSeriesModeler:
             Training data for model fitting.
         arima_order : tuple
             Order of the ARIMA model (p, d, q).
+        low_memory : bool, optional
+            Whether to skip storing the filtered and smoothed states, by default
+            False. Point forecasts remain available, but forecast confidence
+            intervals do not.
+        skip_covariance : bool, optional
+            Whether to skip computing the parameter covariance matrix, by default
+            False. This avoids a numerical Hessian when only forecasts and forecast
+            intervals are needed, but leaves the standard errors in
+            display_model_summary undefined.
 
         Returns
         -------
         ARIMAResultsWrapper
             Fitted ARIMA model results.
         """
+        from statsmodels.tsa.arima.model import ARIMA
+
         warnings.filterwarnings("ignore")
         arima_model = ARIMA(train_data, order=arima_order)
-        arima_result = arima_model.fit()
+        cov_type = "none" if skip_covariance else None
+        arima_result = arima_model.fit(cov_type=cov_type, low_memory=low_memory)
         return arima_result
 
     def display_model_summary(self, arima_result):
@@ -124,9 +218,39 @@ class TimeSeriesModeler:
         Series
             Forecasted values.
         """
-        forecast = model_fit.forecast(steps=steps)
+        forecast, _ = self.forecast_all(model_fit, steps)
         return forecast
 
+    def forecast_all(self, model_fit, steps):
+        """
+        Forecasts future values and their confidence intervals in a single pass.
+
+        ARIMA forecasts are deterministic, so the result is cached per fitted model and
+        number of steps; forecast_arima and forecast_with_confidence_interval share it.
+        Each call returns its own copies of the cached results.
+
+        Parameters
+        ----------
+        model_fit : ARIMAResultsWrapper
+            Fitted ARIMA model results.
+        steps : int
+            Number of steps to forecast into the future.
+
+        Returns
+        -------
+        Series
+            Forecasted values.
+        DataFrame
+            Confidence intervals.
+        """
+        forecasts = _FORECAST_CACHE.setdefault(model_fit, {})
+        if steps not in forecasts:
+            forecast = model_fit.get_forecast(steps=steps)
+            forecasts[steps] = forecast.predicted_mean, forecast.conf_int()
+        # Hand out copies, so a caller editing its result leaves the cache intact
+        predicted_mean, conf_int = forecasts[steps]
+        return predicted_mean.copy(), conf_int.copy()
+
     def plot_forecast(self, train_data, test_data, forecast, title, x_label, y_label):
         """
         Plots the training data, actual prices, and predicted prices.
@@ -146,14 +270,18 @@ class TimeSeriesModeler:
         y_label : str
             Label for the y-axis.
         """
-        plt.figure(figsize=(12, 6))
-        plt.plot(train_data, label="Training Data")
-        plt.plot(test_data, label="Actual Prices", color="orange")
-        plt.plot(test_data.index, forecast, label="Predicted Prices", color="green")
-        plt.title(title)
-        plt.xlabel(x_label)
-        plt.ylabel(y_label)
-        plt.legend()
+        _, ax = plt.subplots(figsize=(12, 6))
+        _plot_lines(
+            ax,
+            [
+                (train_data.index, train_data, "Training Data", "C0", "-"),
+                (test_data.index, test_data, "Actual Prices", "orange", "-"),
+                (test_data.index, forecast, "Predicted Prices", "green", "-"),
+            ],
+        )
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
         plt.show()
 
     def forecast_with_confidence_interval(self, model_fit, steps):
@@ -174,9 +302,7 @@ class TimeSeriesModeler:
         DataFrame
             Confidence intervals.
         """
-        forecast = model_fit.get_forecast(steps=steps)
-        forecast_values = forecast.predicted_mean
-        confidence_intervals = forecast.conf_int()
+        forecast_values, confidence_intervals = self.forecast_all(model_fit, steps)
         return forecast_values, confidence_intervals
 
     def plot_forecast_with_intervals(
@@ -209,22 +335,30 @@ class TimeSeriesModeler:
         y_label : str
             Label for the y-axis.
         """
-        plt.figure(figsize=(15, 8))
-        plt.plot(train_data, label="Training Data", color="blue")
-        plt.plot(test_data, label="Actual Data", color="green")
-        plt.plot(
-            forecast_values, label="Forecasted Values", color="red", linestyle="--"
-        )
-        plt.fill_between(
-            confidence_intervals.index,
+        _, ax = plt.subplots(figsize=(15, 8))
+        ax.fill_between(
+            mdates.date2num(pd.to_datetime(confidence_intervals.index)),
             confidence_intervals.iloc[:, 0],
             confidence_intervals.iloc[:, 1],
             color="pink",
             alpha=0.3,
         )
-        plt.title(title)
-        plt.xlabel(x_label)
-        plt.ylabel(y_label)
-        plt.legend()
-        plt.grid(True)
+        _plot_lines(
+            ax,
+            [
+                (train_data.index, train_data, "Training Data", "blue", "-"),
+                (test_data.index, test_data, "Actual Data", "green", "-"),
+                (
+                    forecast_values.index,
+                    forecast_values,
+                    "Forecasted Values",
+                    "red",
+                    "--",
+                ),
+            ],
+        )
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+        ax.grid(True)
         plt.show()
@@ -1,43 +1,408 @@
 """Module for web scraping real estate data, including URL fetching, house document fetching, and data extraction."""
 
 
+import csv
+import logging
+import re
 import ssl
-from urllib.request import Request, urlopen
-from bs4 import BeautifulSoup as BS
+import threading
+import requests
+import urllib3
+import lxml.html
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup as BS, SoupStrainer
 import pandas as pd
 import time
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Certificate verification is skipped for the listing site, so keep urllib3
+# from warning on every request.
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# One SSL context shared by every fetcher and pooled connection. Without it
+# urllib3 builds a context, and reloads the system CA store, per connection.
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+SUPERCENTERS = (
+    "Costco",
+    "Target",
+    "Walmart",
+    "Safeway",
+    "Lucky",
+    "FoodMaxx",
+    "Trader Joe",
+    "Walgreens",
+)
+MAJOR_INDIAN_GROCERY = (
+    "New India",
+    "Apna Bazaar",
+    "India Cash And Carry",
+    "Trinetra",
+    "Namaste",
+    "Saudagar",
+    "Bharat",
+    "Nilgiris",
+)
+MAJOR_ENTERTAINMENT = ("AMC", "Cinemark", "Theater")
+BOBA = ("Bubble Tea", "Boba")
+HEALTHCARE = (
+    "Hospital",
+    "Clinic",
+    "Kaiser Permanante",
+    "United Health",
+    "Health",
+)
+
+
+def _keyword_pattern(keywords):
+    """Compiles a regex matching any of the keywords as a plain substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# One compiled pattern per has_* flag, searched against the nearby items text
+NEARBY_PATTERNS = {
+    "has_supercenter": _keyword_pattern(SUPERCENTERS),
+    "has_major_indian_grocery": _keyword_pattern(MAJOR_INDIAN_GROCERY),
+    "has_major_entertainment": _keyword_pattern(MAJOR_ENTERTAINMENT),
+    "has_indian_restaurant": _keyword_pattern(("Indian Restaurant",)),
+    "has_chinese_restaurant": _keyword_pattern(("Chinese Restaurant",)),
+    "has_mexican_restaurant": _keyword_pattern(("Mexican Restaurant",)),
+    "has_boba": _keyword_pattern(BOBA),
+    "has_starbucks": _keyword_pattern(("Starbucks",)),
+    "has_healthcare_support": _keyword_pattern(HEALTHCARE),
+    "has_mall": _keyword_pattern(("Mall",)),
+}
+
+# Search result pages are only read for their pagination links and listing
+# cards, so only those subtrees are built. The strainer sees the raw class
+# attribute, hence the token regex for the card class.
+PAGE_LINK_STRAINER = SoupStrainer("a", {"class": "clickable goToPage"}, href=True)
+HOUSE_CARD_STRAINER = SoupStrainer(
+    "div", class_=re.compile(r"(?:^|\s)bottomV2(?:\s|$)")
+)
+
+# Neighbourhood homes figure on the market insights card, e.g. "#12"
+NBD_RE = re.compile(r"#\s*(\d+)")
+
+# Number a stat block starts with, e.g. "3.5" in "3.5 Baths" or "1,763" in "1,763 Sq Ft"
+LEADING_NUMBER_RE = re.compile(r"\s*(\d[\d,]*(?:\.\d+)?)")
+
+
+def _has_class(name):
+    """Builds an XPath test for a class token, as BeautifulSoup matches one class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compiled XPath queries for the fields read from a listing page. Multi-word
+# class values are matched as the whole attribute, single ones as a token.
+XP_KEY_DETAILS = etree.XPath(
+    "//div[normalize-space(@class)='keyDetail font-weight-roman font-size-base']"
+)
+XP_SPANS = etree.XPath(".//span")
+XP_PRICE = etree.XPath(f"//div[{_has_class('statsValue')}]")
+XP_ADDRESS = etree.XPath("//h1[@data-rf-test-id='abp-homeinfo-homeaddress']")
+XP_BEDS = etree.XPath("//div[@data-rf-test-id='abp-beds']")
+XP_BATHS = etree.XPath("//div[@data-rf-test-id='abp-baths']")
+XP_SQFT = etree.XPath("//div[@data-rf-test-id='abp-sqFt']")
+XP_DROUGHT_SCORE = etree.XPath("//tspan[normalize-space(@class)='riskValue redOrange']")
+XP_MARKET_CARD = etree.XPath(
+    "//div[normalize-space(@class)='MarketInsightsRegionCard--cardMetrics row']"
+)
+XP_WALK_SCORE = etree.XPath(
+    "//div[normalize-space(@class)='score inline-block not-last']"
+)
+XP_TRANSIT_SCORE = etree.XPath("//span[normalize-space(@class)='value fair']")
+XP_POI_WIDGET = etree.XPath(f"//div[{_has_class('PointOfInterestWidget')}]")
+XP_POI_TAGS = etree.XPath(f".//div[{_has_class('Tag__text')}]")
+XP_COMPETITIVE_SCORE = etree.XPath("//div[normalize-space(@class)='score most']")
+XP_ACTIVITY_COUNTS = etree.XPath(
+    f"//span[{_has_class('count')}][@data-rf-test-name='activity-count-label']"
+)
+XP_SCHOOL_NAMES = etree.XPath(
+    "//div[normalize-space(@class)='school-name font-size-base font-weight-bold']"
+)
+XP_SCHOOL_RATINGS = etree.XPath(
+    "//span[normalize-space(@class)='rating-num font-size-base font-weight-bold']"
+)
+
+
+def _first_text(tree, xpath, transform=None, default=np.nan):
+    """
+    Returns the text of the first element matched by a compiled XPath query.
+
+    Parameters:
+    tree (HtmlElement): Parsed HTML document or element to search.
+    xpath (XPath): Compiled XPath query returning elements.
+    transform (callable): Optional parser applied to the text.
+    default: Value returned when nothing matches or the text does not parse.
+
+    Returns:
+    The (transformed) text of the first match, or default.
+    """
+    matches = xpath(tree)
+    if not matches:
+        return default
+    text = matches[0].text_content()
+    if transform is None:
+        return text
+    try:
+        return transform(text)
+    except (ValueError, IndexError):
+        return default
+
+
+def _leading_number(text):
+    """Parses the number at the start of a stat block as a float, or NaN."""
+    match = LEADING_NUMBER_RE.match(text)
+    return float(match.group(1).replace(",", "")) if match else np.nan
+
+
+def _neighbourhood_homes(card_text):
+    """Parses the neighbourhood homes figure from the market insights card text."""
+    match = NBD_RE.search(card_text)
+    return int(match.group(1)) if match else np.nan
+
+
+def _nearby_flags(nearby_items):
+    """Returns the has_* flags for the nearby items text; missing text gives 0."""
+    if pd.isna(nearby_items):
+        return dict.fromkeys(NEARBY_PATTERNS, 0)
+    return {
+        flag: int(pattern.search(nearby_items) is not None)
+        for flag, pattern in NEARBY_PATTERNS.items()
+    }
+
+
+# Column schema of the scraped property CSV. It has Records.csv's columns, except
+# that property_url comes last and Nearby_Items, the raw text the has_* flags are
+# derived from, is kept before them.
+COLUMNS = [
+    "List_price",
+    "Address",
+    "Beds",
+    "Baths",
+    "Living_sqft",
+    "Status",
+    "Time on Redfin",
+    "Property Type",
+    "HOA Dues",
+    "Year Built",
+    "Est. Mo. Payment",
+    "Price/Sq.Ft.",
+    "Drought_Score",
+    "Walk_score",
+    "Neighbourhood_Homes",
+    "Transit_score",
+    "Groceries_stores",
+    "Services",
+    "Emergency",
+    "Shopping",
+    "Food_and_Drink",
+    "Schools",
+    "Competitive_Score",
+    "page_view_count",
+    "page_fav_count_30",
+    "page_fav_all_time_count",
+    "Nearby_Items",
+    *NEARBY_PATTERNS,
+    "property_url",
+]
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    An HTTP adapter that spaces out the requests it sends.
+
+    Requests are released no faster than requests_per_second across all threads
+    sharing the adapter, so concurrent fetches only wait as long as the rate
+    requires. Responses served from a requests-cache never reach the adapter and
+    are not delayed. A 429 or 503 response pauses every thread until its
+    Retry-After delay has passed and halves the request rate, which then recovers
+    gradually as requests succeed. Throttled requests are retried through the
+    same schedule. HTTPS connections are opened with the shared SSL_CONTEXT.
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+    # Longest spacing between requests after repeated throttling, in seconds
+    MAX_INTERVAL = 60.0
+
+    def __init__(self, requests_per_second=1.0, max_attempts=4, **kwargs):
+        """
+        Initializes the adapter and its request schedule.
+
+        Parameters:
+        requests_per_second (float): Highest request rate sent to the server.
+        max_attempts (int): Times a throttled request is sent before its 429 or
+            503 response is returned.
+        **kwargs: Passed on to HTTPAdapter.
+        """
+        super().__init__(**kwargs)
+        self.base_interval = 1.0 / requests_per_second
+        self.interval = self.base_interval
+        self.max_attempts = max_attempts
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def init_poolmanager(self, *args, **kwargs):
+        """
+        Creates the connection pool manager, using SSL_CONTEXT for HTTPS.
+        """
+        kwargs.setdefault("ssl_context", SSL_CONTEXT)
+        super().init_poolmanager(*args, **kwargs)
+
+    def _wait_for_slot(self):
+        """
+        Blocks until the next free request slot.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _back_off(self, response):
+        """
+        Slows the schedule down after a throttling response.
+
+        Parameters:
+        response (Response): The 429 or 503 response.
+        """
+        try:
+            delay = Retry().parse_retry_after(response.headers["Retry-After"])
+        except (KeyError, urllib3.exceptions.InvalidHeader):
+            delay = 0.0
+        with self._lock:
+            self.interval = min(self.interval * 2, self.MAX_INTERVAL)
+            self._next_slot = max(
+                self._next_slot, time.monotonic() + max(delay, self.interval)
+            )
+
+    def _recover(self):
+        """
+        Moves the request spacing back towards the configured rate.
+        """
+        with self._lock:
+            self.interval = max(self.base_interval, self.interval * 0.9)
+
+    def send(self, request, **kwargs):
+        """
+        Sends the request in the next free slot, retrying throttled responses.
+
+        Parameters:
+        request (PreparedRequest): Request to send.
+        **kwargs: Passed on to HTTPAdapter.send.
+
+        Returns:
+        Response: Response from the server.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            self._wait_for_slot()
+            response = super().send(request, **kwargs)
+            if response.status_code not in self.THROTTLE_STATUSES:
+                self._recover()
+                return response
+            self._back_off(response)
+            if attempt < self.max_attempts:
+                response.close()
+        return response
 
 
 class HouseDocumentFetcher:
     """
     A class to fetch HTML documents of house listings.
 
-    This class uses SSL context to bypass certain SSL certificate verification issues.
+    This class keeps one requests session with a pooled HTTPS adapter, so
+    repeated fetches from the same host reuse keep-alive connections. The host
+    name is therefore resolved once per pooled connection, at most pool_size
+    times for a whole scrape, rather than once per page. SSL
+    certificate verification is disabled to bypass certain verification issues.
+    Responses can optionally be cached on disk with requests-cache, so that
+    re-running a scrape reads unchanged pages locally. Requests that do reach
+    the server are rate limited by a RateLimitedAdapter.
     """
-    def __init__(self):
+    def __init__(
+        self,
+        pool_size=20,
+        timeout=10,
+        cache_name=None,
+        expire_after=86400,
+        requests_per_second=1.0,
+    ):
         """
-        Initializes the SSL context.
-        """
-        self.ctx = ssl.create_default_context()
-        self.ctx.check_hostname = False
-        self.ctx.verify_mode = ssl.CERT_NONE
+        Initializes the pooled HTTP session.
 
-    def fetch_house_doc(self, house_url):
+        Parameters:
+        pool_size (int): Number of connections kept alive per host. Use at least
+            as many as the threads fetching through this instance.
+        timeout (float): Seconds to wait for the server before giving up.
+        cache_name (str): Path of the SQLite response cache. No cache is used
+            when None.
+        expire_after (int): Seconds a cached response stays valid.
+        requests_per_second (float): Highest rate of requests sent to the server.
+        """
+        self.timeout = timeout
+        if cache_name is None:
+            self.session = requests.Session()
+        else:
+            import requests_cache
+
+            self.session = requests_cache.CachedSession(
+                cache_name, expire_after=expire_after
+            )
+        # pool_block keeps threads beyond pool_size waiting for a kept-alive
+        # connection instead of opening one that is closed right after use.
+        adapter = RateLimitedAdapter(
+            requests_per_second,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Listing pages compress well; requests decodes the body transparently
+        self.session.headers.update(
+            {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"}
+        )
+        self.session.verify = False
+
+    def fetch_house_doc(self, house_url, parse_only=None):
         """
         Fetches the HTML document for a given house URL.
 
         Parameters:
         house_url (str): URL of the house listing.
+        parse_only (SoupStrainer): Restricts parsing to the matching elements.
+            The whole document is parsed when None.
 
         Returns:
         BeautifulSoup object: Parsed HTML document of the house listing.
         """
-        req = Request(house_url, headers={"User-Agent": "Mozilla/5.0"})
-        webpage = urlopen(req, context=self.ctx).read()
-        house_page_doc = BS(webpage, "html.parser")
+        webpage = self.fetch_house_html(house_url)
+        house_page_doc = BS(webpage, "lxml", parse_only=parse_only)
         return house_page_doc
 
+    def fetch_house_html(self, house_url):
+        """
+        Fetches the raw HTML of a given house URL without parsing it.
+
+        Parameters:
+        house_url (str): URL of the house listing.
+
+        Returns:
+        bytes: HTML content of the house listing.
+        """
+        response = self.session.get(house_url, timeout=self.timeout, verify=False)
+        response.raise_for_status()
+        return response.content
+
 
 class URLFetcher:
     """
@@ -54,7 +419,9 @@ class URLFetcher:
         Returns:
         list: List of all fetched URLs.
         """
-        mainurldoc = house_doc_fetcher.fetch_house_doc(main_url)
+        mainurldoc = house_doc_fetcher.fetch_house_doc(
+            main_url, parse_only=PAGE_LINK_STRAINER
+        )
         base_url = "https://www.redfin.com"
         url_list = [main_url]
         for hrefs in mainurldoc.findAll(
@@ -83,7 +450,7 @@ class HouseURLExtractor:
         """
         house_urls = []
         for url in url_list:
-            doc = house_doc_fetcher.fetch_house_doc(url)
+            doc = house_doc_fetcher.fetch_house_doc(url, parse_only=HOUSE_CARD_STRAINER)
             divs = doc.find_all("div", {"class": "bottomV2"})
             for div in divs:
                 href = div.a.get("href")
@@ -99,299 +466,147 @@ class HouseDataExtractor:
     A class to extract and save property details from house listing URLs.
     """
     
-    def scrape_and_save_property_details(url_list, filename, batch_size=10):
+    def scrape_and_save_property_details(
+        url_list, filename, batch_size=10, house_doc_fetcher=None, max_workers=16
+    ):
         """
         Scrapes and saves property details from the given list of URLs.
 
+        Pages are downloaded by a pool of worker threads and parsed in list order,
+        so rows are saved in the order of url_list.
+        Each row is written with its has_* flags as soon as it is parsed, and the
+        file is flushed every batch_size rows. The returned DataFrame gets its
+        flags from add_flags in one pass at the end.
+
         Parameters:
         url_list (list): List of property URLs to scrape.
         filename (str): File name to save the property details.
-        batch_size (int): Number of records to process before saving to file.
+        batch_size (int): Number of records to process before flushing the file.
+        house_doc_fetcher (HouseDocumentFetcher): Fetcher shared by all requests.
+            A new one with a connection per worker is created when not given.
+        max_workers (int): Number of pages downloaded concurrently.
 
         Returns:
-        DataFrame: DataFrame containing the scraped property details.
+        DataFrame: DataFrame containing the scraped property details, with the
+            columns listed in COLUMNS.
         """
-        details_df = pd.DataFrame(columns=[...])  # Specify your columns
-
-        for i, url in enumerate(url_list):
-            try:
-                house_doc = HouseDocumentFetcher().fetch_house_doc(url)
-                house_dict = HouseDataExtractor.extract_house_details(house_doc)
-                details_df = details_df.append(house_dict, ignore_index=True)
-
-                if i % batch_size == 0:
-                    details_df.to_csv(filename, index=False)
+        if house_doc_fetcher is None:
+            house_doc_fetcher = HouseDocumentFetcher(pool_size=max_workers)
+        rows = []
+
+        with open(filename, "w", newline="") as csv_file, ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            writer = csv.DictWriter(csv_file, fieldnames=COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            futures = [
+                executor.submit(house_doc_fetcher.fetch_house_html, url)
+                for url in url_list
+            ]
+            for url, future in zip(url_list, futures):
+                try:
+                    house_dict = HouseDataExtractor.extract_house_details(
+                        future.result()
+                    )
+                    house_dict["property_url"] = url
+                    rows.append(house_dict)
+                    # Missing values are left empty, as DataFrame.to_csv writes them
+                    row = {
+                        key: value
+                        for key, value in house_dict.items()
+                        if not pd.api.types.is_scalar(value) or pd.notna(value)
+                    }
+                    row.update(_nearby_flags(house_dict["Nearby_Items"]))
+                    writer.writerow(row)
+
+                    if len(rows) % batch_size == 0:
+                        csv_file.flush()
+
+                except Exception as error:
+                    logger.warning("Skipping %s: %r", url, error)
+
+        return HouseDataExtractor.add_flags(pd.DataFrame(rows, columns=COLUMNS))
+
+    def add_flags(details_df):
+        """
+        Derives the has_* nearby amenity flags from the Nearby_Items column.
 
-                time.sleep(3)  # Adjust delay as necessary
+        Each flag is one vectorized regex search over the column, using the
+        NEARBY_PATTERNS keyword alternations. Listings without nearby items get 0.
 
-            except Exception as e:
-                # Handle or log the exception
-                pass
+        Parameters:
+        details_df (DataFrame): Scraped property details with a Nearby_Items column.
 
-        details_df.to_csv(filename, index=False)
+        Returns:
+        DataFrame: The same DataFrame with an int8 column per has_* flag.
+        """
+        nearby_items = details_df["Nearby_Items"].astype("string[pyarrow]")
+        for flag, pattern in NEARBY_PATTERNS.items():
+            details_df[flag] = nearby_items.str.contains(
+                pattern.pattern, regex=True, na=False
+            ).astype("int8")
         return details_df
 
-    def extract_house_details(doc):
+    def extract_house_details(house_html):
         """
         Extracts details of a house from its HTML document.
 
         Parameters:
-        doc (BeautifulSoup): Parsed HTML document of the house listing.
+        house_html (bytes): Raw HTML of the house listing page.
 
         Returns:
         dict: Dictionary containing extracted house details.
         """
-        SuperCenters = [
-            "Costco",
-            "Target",
-            "Walmart",
-            "Safeway",
-            "Lucky",
-            "FoodMaxx",
-            "Trader Joe",
-            "Walgreens",
-        ]
-        Major_Indian_Grocery = [
-            "New India",
-            "Apna Bazaar",
-            "India Cash And Carry",
-            "Trinetra",
-            "Namaste",
-            "Saudagar",
-            "Bharat",
-            "Nilgiris",
-        ]
-        Major_Entertainment = ["AMC", "Cinemark", "Theater"]
-        Boba = ["Bubble Tea", "Boba"]
-        Healthcare = [
-            "Hospital",
-            "Clinic",
-            "Kaiser Permanante",
-            "United Health",
-            "Health",
-        ]
+        tree = lxml.html.fromstring(house_html)
 
         table_dict = {}
-        for i in doc.findAll(
-            "div", {"class": "keyDetail font-weight-roman font-size-base"}
-        ):
-            x = i.findChildren("span")[0].get_text().split("\n")
-            y = i.findChildren("span")[1].get_text().split()
-            z = zip(x, y)
-            table_dict.update(dict(list(z)))
-
-        try:
-            price = doc.find("div", attrs={"class": "statsValue"}).text.split("$")[1]
-        except:
-            price = np.nan
-        try:
-            Address = doc.find(
-                "h1", attrs={"data-rf-test-id": "abp-homeinfo-homeaddress"}
-            ).text
-        except:
-            Address = np.nan
-
-        try:
-            bed_str = doc.find("div", attrs={"data-rf-test-id": "abp-beds"}).text.split(
-                "B"
-            )[0]
-            beds = int(bed_str)
-        except:
-            beds = np.nan
-
-        try:
-            str = doc.find("div", attrs={"data-rf-test-id": "abp-baths"}).text.split(
-                "B"
-            )[0]
-            bath = float(str)
-        except:
-            bath = np.nan
-
-        try:
-            sqft_str = (
-                doc.find("div", attrs={"data-rf-test-id": "abp-sqFt"})
-                .text.split("S")[0]
-                .replace(",", "")
-            )
-            living_sqft = float(sqft_str)
-        except:
-            living_sqft = np.nan
-
-        try:
-            d_score = int(
-                doc.find("tspan", attrs={"class": "riskValue redOrange"}).text
-            )
-        except:
-            d_score = np.nan
-
-        try:
-            nbd_homes = int(
-                doc.find(
-                    "div", attrs={"class": "MarketInsightsRegionCard--cardMetrics row"}
-                )
-                .text.split()[-3]
-                .strip("Sale-to-List")
-                .strip("#")
-            )
-        except:
-            nbd_homes = np.nan
-
-        try:
-            wa_score = int(
-                doc.findAll("div", {"class": "score inline-block not-last"})[0]
-                .get_text()
-                .split(" ")[0]
-            )
-        except:
-            wa_score = np.nan
-        try:
-            trans_score = int(
-                doc.findAll("span", {"class": "value fair"})[0].get_text()
-            )
-        except:
-            trans_score = np.nan
-
-        for div in doc.findAll("div", {"class": "PointOfInterestWidget"}):
-            groceries = int(div.findAll("div", {"class": "Tag__text"})[1].get_text())
-            services = int(div.findAll("div", {"class": "Tag__text"})[-1].get_text())
-            emergency = int(div.findAll("div", {"class": "Tag__text"})[-2].get_text())
-            shopping = int(div.findAll("div", {"class": "Tag__text"})[4].get_text())
-            food_drink = int(div.findAll("div", {"class": "Tag__text"})[2].get_text())
-
-        # places nearby items
-        try:
-            Nearby_Items = doc.find(
-                "div", attrs={"class": "PointOfInterestWidget"}
-            ).text
-        except:
+        for i in XP_KEY_DETAILS(tree):
+            spans = XP_SPANS(i)
+            x = spans[0].text_content().split("\n")
+            y = spans[1].text_content().split()
+            table_dict.update(zip(x, y))
+
+        price = _first_text(tree, XP_PRICE, lambda text: text.split("$")[1])
+        Address = _first_text(tree, XP_ADDRESS)
+        beds = _first_text(tree, XP_BEDS, lambda text: int(text.split("B")[0]))
+        bath = _first_text(tree, XP_BATHS, _leading_number)
+        living_sqft = _first_text(tree, XP_SQFT, _leading_number)
+        d_score = _first_text(tree, XP_DROUGHT_SCORE, int)
+        nbd_homes = _first_text(tree, XP_MARKET_CARD, _neighbourhood_homes)
+        wa_score = _first_text(
+            tree, XP_WALK_SCORE, lambda text: int(text.split(" ")[0])
+        )
+        trans_score = _first_text(tree, XP_TRANSIT_SCORE, int)
+
+        # places nearby: tag counts and the full widget text
+        poi_widgets = XP_POI_WIDGET(tree)
+        if poi_widgets:
+            tags = XP_POI_TAGS(poi_widgets[0])
+            Nearby_Items = poi_widgets[0].text_content()
+        else:
+            tags = []
             Nearby_Items = np.nan
+        if len(tags) >= 5:
+            groceries, food_drink, shopping, emergency, services = (
+                int(tags[i].text_content()) for i in (1, 2, 4, -2, -1)
+            )
+        else:
+            groceries = food_drink = shopping = emergency = services = np.nan
 
         # competitive score
-        try:
-            Competitive_Score = doc.find("div", attrs={"class": "score most"}).text
-        except:
-            Competitive_Score = np.nan
+        Competitive_Score = _first_text(tree, XP_COMPETITIVE_SCORE)
 
         # activity views
         # views, favorite, favrotie all time, x-outs, all-time x-outs, tours, all- time tours
-        try:
-            activity_lis = [
-                activity.get_text()
-                for activity in doc.findAll(
-                    "span",
-                    attrs={
-                        "class": "count",
-                        "data-rf-test-name": "activity-count-label",
-                    },
-                )
-            ]
-        except:
-            activity_lis = np.nan
-
-        try:
-            view_count = activity_lis[0]
-        except:
-            view_count = np.nan
-
-        try:
-            fav_count_30 = activity_lis[1]
-        except:
-            fav_count_30 = np.nan
-
-        try:
-            fav_all_time = activity_lis[2]
-        except:
-            fav_all_time = np.nan
-
-        school_dict = {}
-        name_lis = [
-            school.get_text()
-            for school in doc.findAll(
-                "div", {"class": "school-name font-size-base font-weight-bold"}
-            )
-        ]
-        # dis_lis= [float(dis.get_text().strip("mi")) for dis in doc.findAll('div', {'class':'subsection-number'}) if "mi" in dis.get_text()]
-        rating_lis = [
-            school.get_text()
-            for school in doc.findAll(
-                "span", {"class": "rating-num font-size-base font-weight-bold"}
-            )
+        activity_lis = [
+            activity.text_content() for activity in XP_ACTIVITY_COUNTS(tree)
         ]
-        for x, y in zip(name_lis, rating_lis):
-            school_dict[x] = y
-
-        has_supercenter = 0
-        has_major_indian_grocery = 0
-        has_major_entertainment = 0
-        has_indian_restaurant = 0
-        has_chinese_restaurant = 0
-        has_mexican_restaurant = 0
-        has_boba = 0
-        has_starbucks = 0
-        has_healthcare_support = 0
-        has_mall = 0
-
-        try:
-            if any(centre in Nearby_Items for centre in SuperCenters):
-                has_supercenter = 1
-        except:
-            has_supercenter = 0
-
-        try:
-            if any(grocery in Nearby_Items for grocery in Major_Indian_Grocery):
-                has_major_indian_grocery = 1
-        except:
-            has_major_indian_grocery = 0
-
-        try:
-            if any(
-                entertainment in Nearby_Items for entertainment in Major_Entertainment
-            ):
-                has_major_entertainment = 1
-        except:
-            has_major_entertainment = 0
+        view_count, fav_count_30, fav_all_time = (activity_lis + [np.nan] * 3)[:3]
 
-        try:
-            if "Indian Restaurant" in Nearby_Items:
-                has_indian_restaurant = 1
-        except:
-            has_indian_restaurant = 0
-
-        try:
-            if "Chinese Restaurant" in Nearby_Items:
-                has_chinese_restaurant = 1
-        except:
-            has_chinese_restaurant = 0
-
-        try:
-            if "Mexican Restaurant" in Nearby_Items:
-                has_mexican_restaurant = 1
-        except:
-            has_mexican_restaurant = 0
-
-        try:
-            if any(boba_tea in Nearby_Items for boba_tea in Boba):
-                has_boba = 1
-        except:
-            has_boba = 0
-
-        try:
-            if "Starbucks" in Nearby_Items:
-                has_starbucks = 1
-        except:
-            has_starbucks = 0
-
-        try:
-            if any(health in Nearby_Items for health in Healthcare):
-                has_healthcare_support = 1
-        except:
-            has_healthcare_support = 0
-
-        try:
-            if "Mall" in Nearby_Items:
-                has_mall = 1
-        except:
-            has_mall = 0
+        name_lis = [school.text_content() for school in XP_SCHOOL_NAMES(tree)]
+        # dis_lis= [float(dis.get_text().strip("mi")) for dis in doc.findAll('div', {'class':'subsection-number'}) if "mi" in dis.get_text()]
+        rating_lis = [school.text_content() for school in XP_SCHOOL_RATINGS(tree)]
+        school_dict = dict(zip(name_lis, rating_lis))
 
         l = {
             "List_price": price,
@@ -413,16 +628,7 @@ class HouseDataExtractor:
             "page_view_count": view_count,
             "page_fav_count_30": fav_count_30,
             "page_fav_all_time_count": fav_all_time,
-            "has_supercenter": has_supercenter,
-            "has_major_indian_grocery": has_major_indian_grocery,
-            "has_major_entertainment": has_major_entertainment,
-            "has_indian_restaurant": has_indian_restaurant,
-            "has_chinese_restaurant": has_chinese_restaurant,
-            "has_mexican_restaurant": has_mexican_restaurant,
-            "has_boba": has_boba,
-            "has_starbucks": has_starbucks,
-            "has_healthcare_support": has_healthcare_support,
-            "has_mall": has_mall,
+            "Nearby_Items": Nearby_Items,
         }
         table_dict.update(l)
         return table_dict